@@ -1,5 +1,6 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -8,6 +9,7 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from backend.routes import analysis, chat, contract, upload
+from lexguard.nlp.vector_store import migrate_legacy_collection
 
 # Configure logging
 logging.basicConfig(
@@ -22,6 +24,11 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     """Lifespan events for startup and shutdown."""
     logger.info("Starting LexGuard API server...")
+    try:
+        # Move contracts indexed before the cosine collection was introduced
+        await asyncio.to_thread(migrate_legacy_collection)
+    except Exception as e:
+        logger.error(f"Vector store migration failed; will retry on next start: {e}")
     yield
     logger.info("Shutting down LexGuard API server...")
 
@@ -303,7 +303,9 @@ async def analyze_clause(contract_id: str, clause_id: str, request: ClauseUpdate
         target_clause.text = request.text
 
         # Re-classify
-        target_clause.clause_type = classify_clause(request.text)
+        target_clause.clause_type = classify_clause(
+            request.text, text_lower=target_clause.text_lower
+        ).value
 
         # Re-calculate risk
         calculate_clause_risk(target_clause, use_llm=False)
@@ -12,8 +12,8 @@ from lexguard.config import settings
 from lexguard.ingest import clean_contract_text, extract_text_from_pdf
 from lexguard.ingest.pdf_extractor import should_use_ocr
 from lexguard.models import Clause, Contract
-from lexguard.nlp import VectorStore, classify_clause, split_into_clauses
-from lexguard.risk import calculate_clause_risk, suggest_negotiation_points
+from lexguard.nlp import VectorStore, classify_clauses, split_into_clauses
+from lexguard.risk import calculate_contract_risks, suggest_negotiation_points
 from lexguard.storage import save_contract
 
 logger = logging.getLogger(__name__)
@@ -112,33 +112,38 @@ async def upload_contract(file: UploadFile = File(...)):
             clauses=[],
         )
 
-        # Process each clause
-        clauses = []
-        for i, clause_text in enumerate(clause_texts):
-            # Classify clause
-            clause_type = classify_clause(clause_text, use_llm=False)
-
-            # Create clause object
-            clause = Clause(
+        # Build clauses first so classification and risk scoring share each
+        # clause's cached lowercase text. Every field comes from our own
+        # chunker, so skip pydantic validation.
+        clauses = [
+            Clause.model_construct(
                 id=f"{contract_id}_clause_{i}",
                 contract_id=contract_id,
                 index=i,
                 text=clause_text,
-                clause_type=clause_type,
             )
+            for i, clause_text in enumerate(clause_texts)
+        ]
+
+        # Classify all clauses in one batch
+        clause_types = classify_clauses(
+            clause_texts, use_llm=False, texts_lower=[c.text_lower for c in clauses]
+        )
 
-            # Calculate risk
-            risk = calculate_clause_risk(clause, use_llm=False)
-            clause.risk_score = risk.score
-            clause.risk_level = risk.level
+        for clause, clause_type in zip(clauses, clause_types):
+            # Stored as its value, as validation does with use_enum_values
+            clause.clause_type = clause_type.value
 
+        # Calculate risk for all clauses in one batch (also sets risk_score/risk_level)
+        risks = calculate_contract_risks(clauses, use_llm=False)
+
+        # Process each clause
+        for clause, risk in zip(clauses, risks):
             # Get negotiation suggestions (only for high/medium risk)
             if risk.level in ("high", "medium"):
                 suggestions = suggest_negotiation_points(clause, use_llm=False)
                 risk.recommendations = suggestions
 
-            clauses.append(clause)
-
         contract.clauses = clauses
 
         # Store embeddings in vector database
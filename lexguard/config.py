@@ -30,13 +30,30 @@ class Settings(BaseSettings):
     ollama_model: str = os.getenv("OLLAMA_MODEL", "llama3.2")
     # Default to localhost, but should be set to public Ollama server URL for Railway
     ollama_base_url: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+    # Maximum concurrent embedding requests sent to Ollama
+    ollama_concurrency: int = int(os.getenv("OLLAMA_CONCURRENCY", "8"))
+    # Reuse LLM risk verdicts for identical clauses (stored in DATA_DIR/llm_verdicts.sqlite3)
+    llm_verdict_cache: bool = os.getenv("LLM_VERDICT_CACHE", "true").lower() == "true"
 
     # Embedding Configuration
     # Default to chromadb (lightweight, no heavy dependencies like PyTorch)
-    embedding_provider: Literal["ollama", "sentence-transformers", "openai", "gemini", "chromadb"] = os.getenv(
-        "EMBEDDING_PROVIDER", "chromadb"
-    )
+    embedding_provider: Literal[
+        "ollama", "sentence-transformers", "openai", "gemini", "chromadb", "tei"
+    ] = os.getenv("EMBEDDING_PROVIDER", "chromadb")
     embedding_model: str = os.getenv("EMBEDDING_MODEL", "")
+    # Hugging Face Text-Embeddings-Inference server (EMBEDDING_PROVIDER=tei)
+    tei_base_url: str = os.getenv("TEI_BASE_URL", "http://localhost:8080")
+    # Device for sentence-transformers ("cuda", "mps", "cpu"); empty = auto-detect (cuda > mps > cpu)
+    embedding_device: str = os.getenv("EMBEDDING_DEVICE", "")
+    # Persist computed embeddings under DATA_DIR/embedding_cache (requires diskcache)
+    embedding_disk_cache: bool = os.getenv("EMBEDDING_DISK_CACHE", "false").lower() == "true"
+    # Hash for the lightweight (chromadb) embedding's hash features. Changing it
+    # changes vectors, so keep "sha256" while existing collections are in use.
+    simple_embedding_hash: Literal["sha256", "blake2b", "xxh3"] = os.getenv(
+        "SIMPLE_EMBEDDING_HASH", "sha256"
+    )
+    # Inference backend for sentence-transformers ("onnx" needs sentence-transformers>=3.2 + optimum)
+    embedding_backend: Literal["torch", "onnx"] = os.getenv("EMBEDDING_BACKEND", "torch")
 
     # Storage Configuration
     chroma_db_path: Path = Path(os.getenv("CHROMA_DB_PATH", "./data/chroma"))
@@ -71,6 +88,8 @@ class Settings(BaseSettings):
         elif self.embedding_provider == "openai":
             if not self.embedding_model:
                 self.embedding_model = "text-embedding-3-small"
+        elif self.embedding_provider == "tei":
+            pass  # The model is chosen when the TEI server is started
         else:  # gemini
             if not self.embedding_model:
                 self.embedding_model = "models/embedding-001"
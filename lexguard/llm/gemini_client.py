@@ -157,6 +157,32 @@ class GeminiEmbeddings:
             logger.error(f"Gemini embeddings API error: {e}")
             raise
 
+    def embed_documents_bulk(self, texts: List[str], batch_size: int = 100) -> List[List[float]]:
+        """
+        Get embeddings for many documents with one batchEmbedContents call per batch.
+
+        Args:
+            texts: Documents to embed
+            batch_size: Texts per request (the API accepts at most 100)
+
+        Returns:
+            Embeddings in input order
+        """
+        embeddings: List[List[float]] = []
+        try:
+            for start in range(0, len(texts), batch_size):
+                result = genai.embed_content(
+                    model=self.model,
+                    content=texts[start : start + batch_size],
+                    task_type="retrieval_document",
+                )
+                embeddings.extend(result["embedding"])
+            return embeddings
+
+        except Exception as e:
+            logger.error(f"Gemini bulk embeddings API error: {e}")
+            raise
+
 
 def get_gemini_embeddings(
     model_name: str = "models/embedding-001",
@@ -16,7 +16,9 @@ Clause text:
 Respond with just the category name (lowercase, use underscores).
 """
 
-# Contract summary prompt
+# Contract summary prompt; bump the version whenever the template changes so
+# cached summaries are not reused
+CONTRACT_SUMMARY_PROMPT_VERSION = "1"
 CONTRACT_SUMMARY_PROMPT = """You are a legal expert. Analyze the following contract and provide a clear, plain-English summary.
 
 Your summary should include:
@@ -71,7 +73,9 @@ Provide a clear, accurate answer. If the answer isn't in the provided context, s
 Be specific and cite relevant clause details when possible.
 """
 
-# Risk scoring prompt (for LLM-enhanced scoring)
+# Risk scoring prompt (for LLM-enhanced scoring); bump the version whenever the
+# template changes so cached verdicts are not reused
+RISK_SCORING_PROMPT_VERSION = "1"
 RISK_SCORING_PROMPT = """Analyze this contract clause and assign a risk score from 0.0 (no risk) to 1.0 (high risk).
 
 Clause type: {clause_type}
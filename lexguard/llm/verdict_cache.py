@@ -0,0 +1,123 @@
+"""Persistent cache of LLM verdicts keyed by a fingerprint of their inputs."""
+
+import functools
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Optional
+
+import orjson
+
+from lexguard.config import settings
+
+logger = logging.getLogger(__name__)
+
+# SQLite connections are shared across worker threads, so serialize access
+_lock = threading.Lock()
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def verdict_key(task: str, prompt_version: str, *parts: str) -> str:
+    """
+    Build a content-addressed cache key for an LLM request.
+
+    The key covers the task, prompt version, active provider and model, and
+    the request inputs. Text parts are lowercased and whitespace-collapsed
+    so trivially different copies of a clause share one verdict.
+
+    Args:
+        task: Name of the LLM task (e.g. "risk")
+        prompt_version: Version of the prompt template used for the task
+        *parts: Request inputs, such as clause type and clause text
+
+    Returns:
+        Hex SHA-256 fingerprint
+    """
+    normalized = (_WHITESPACE.sub(" ", part).strip().lower() for part in parts)
+    fingerprint = "|".join(
+        (task, prompt_version, settings.llm_provider, active_model(), *normalized)
+    )
+    return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+
+def get_verdict(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up a cached verdict.
+
+    Args:
+        key: Key from verdict_key
+
+    Returns:
+        The cached verdict, or None if the cache is disabled or has no entry
+    """
+    if not settings.llm_verdict_cache:
+        return None
+
+    # The cache is an optimization: on any storage error, report a miss
+    try:
+        with _lock:
+            row = _get_connection().execute(
+                "SELECT verdict FROM verdicts WHERE key = ?", (key,)
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+    except (sqlite3.Error, ValueError) as e:
+        logger.warning(f"LLM verdict cache lookup failed: {e}")
+        return None
+
+
+def put_verdict(key: str, verdict: Dict[str, Any]) -> None:
+    """
+    Store a verdict.
+
+    Args:
+        key: Key from verdict_key
+        verdict: JSON-serializable LLM result
+    """
+    if not settings.llm_verdict_cache:
+        return
+
+    try:
+        with _lock:
+            connection = _get_connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO verdicts (key, verdict) VALUES (?, ?)",
+                (key, orjson.dumps(verdict)),
+            )
+            connection.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"LLM verdict cache write failed: {e}")
+
+
+def clear_verdict_cache() -> None:
+    """Drop all cached verdicts (useful after changing prompts or models)."""
+    with _lock:
+        connection = _get_connection()
+        connection.execute("DELETE FROM verdicts")
+        connection.commit()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_connection() -> sqlite3.Connection:
+    """Open the cache database (cached after the first call)."""
+    path = settings.data_dir / "llm_verdicts.sqlite3"
+    logger.info(f"Opening LLM verdict cache at {path}")
+
+    connection = sqlite3.connect(str(path), check_same_thread=False)
+    connection.execute(
+        "CREATE TABLE IF NOT EXISTS verdicts (key TEXT PRIMARY KEY, verdict BLOB NOT NULL)"
+    )
+    connection.commit()
+    return connection
+
+
+def active_model() -> str:
+    """Return the model name used by the configured LLM provider."""
+    models = {
+        "openai": settings.openai_model,
+        "gemini": settings.gemini_model,
+        "ollama": settings.ollama_model,
+    }
+    return models.get(settings.llm_provider, "")
@@ -50,5 +50,11 @@ class Clause(BaseModel):
 
         use_enum_values = True
 
+    @property
+    def text_lower(self) -> str:
+        """Lowercased clause text, shared by classification and risk scoring."""
+        # Not cached: model_copy(update=...) copies __dict__ without
+        # __setattr__, so a cached value could outlive an edited text
+        return self.text.lower()
 
 
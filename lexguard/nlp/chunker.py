@@ -94,8 +94,12 @@ def _is_likely_header(text: str) -> bool:
     """
     text = text.strip()
 
+    # Long paragraphs are never headers; skip the uppercase scan entirely
+    if len(text) >= 100:
+        return False
+
     # Very short and all uppercase
-    if len(text) < 100 and text.isupper():
+    if text.isupper():
         return True
 
     # Single line, short, no period at end
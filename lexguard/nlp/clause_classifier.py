@@ -2,14 +2,14 @@
 
 import re
 import logging
-from typing import Optional
+from typing import List, Optional
 
 from lexguard.models.clause import ClauseType
 
 logger = logging.getLogger(__name__)
 
 
-# Keyword patterns for each clause type
+# Keyword patterns for each clause type (lowercase; matched against lowercased text)
 CLAUSE_PATTERNS = {
     ClauseType.TERMINATION: [
         r"\btermination\b",
@@ -68,8 +68,16 @@ CLAUSE_PATTERNS = {
     ],
 }
 
+# CLAUSE_PATTERNS compiled once at import, so matching skips re's pattern cache
+_COMPILED_PATTERNS = {
+    clause_type: tuple(re.compile(pattern) for pattern in patterns)
+    for clause_type, patterns in CLAUSE_PATTERNS.items()
+}
+
 
-def classify_clause(text: str, use_llm: bool = False) -> ClauseType:
+def classify_clause(
+    text: str, use_llm: bool = False, text_lower: Optional[str] = None
+) -> ClauseType:
     """
     Classify a clause into a specific type.
 
@@ -80,12 +88,13 @@ def classify_clause(text: str, use_llm: bool = False) -> ClauseType:
     Args:
         text: Clause text to classify
         use_llm: Whether to use LLM for refinement
+        text_lower: Precomputed ``text.lower()``, if the caller already has it
 
     Returns:
         ClauseType enum value
     """
     # Stage 1: Rule-based classification
-    clause_type = _classify_with_rules(text)
+    clause_type = _classify_with_rules(text_lower if text_lower is not None else text.lower())
 
     # Stage 2: LLM refinement (if requested and clause is ambiguous)
     if use_llm and clause_type in (ClauseType.UNSURE, ClauseType.MISC):
@@ -97,32 +106,52 @@ def classify_clause(text: str, use_llm: bool = False) -> ClauseType:
     return clause_type
 
 
-def _classify_with_rules(text: str) -> ClauseType:
+def classify_clauses(
+    texts: List[str], use_llm: bool = False, texts_lower: Optional[List[str]] = None
+) -> List[ClauseType]:
     """
-    Classify clause using keyword pattern matching.
+    Classify many clauses at once.
+
+    Results are returned in the same order as ``texts``. Matching is
+    CPU-bound and holds the GIL, so clauses are classified in a plain loop.
 
     Args:
-        text: Clause text
+        texts: Clause texts to classify
+        use_llm: Whether to use LLM for refinement
+        texts_lower: Precomputed lowercased texts, parallel to ``texts``
 
     Returns:
-        Most likely ClauseType based on keyword matches
+        List of ClauseType values, one per input text
     """
-    text_lower = text.lower()
-    scores = {clause_type: 0 for clause_type in ClauseType}
+    if texts_lower is None:
+        texts_lower = [text.lower() for text in texts]
 
-    for clause_type, patterns in CLAUSE_PATTERNS.items():
-        for pattern in patterns:
-            matches = len(re.findall(pattern, text_lower, re.IGNORECASE))
-            scores[clause_type] += matches
+    return [
+        classify_clause(text, use_llm=use_llm, text_lower=text_lower)
+        for text, text_lower in zip(texts, texts_lower)
+    ]
 
-    # Find the type with the highest score
-    max_score = max(scores.values())
 
-    if max_score == 0:
-        return ClauseType.MISC
+def _classify_with_rules(text_lower: str) -> ClauseType:
+    """
+    Classify clause using keyword pattern matching.
 
-    # Get the clause type with the highest score
-    best_type = max(scores.items(), key=lambda x: x[1])[0]
+    Args:
+        text_lower: Lowercased clause text
+
+    Returns:
+        Most likely ClauseType based on keyword matches
+    """
+    best_type = ClauseType.MISC
+    best_score = 0
+
+    # Track the leader while scoring; strict ">" keeps the first type on ties
+    for clause_type, patterns in _COMPILED_PATTERNS.items():
+        score = 0
+        for pattern in patterns:
+            score += len(pattern.findall(text_lower))
+        if score > best_score:
+            best_type, best_score = clause_type, score
 
     return best_type
 
@@ -181,11 +210,11 @@ def get_classification_confidence(text: str, clause_type: ClauseType) -> float:
         return 0.5  # Default confidence for MISC/UNSURE
 
     text_lower = text.lower()
-    patterns = CLAUSE_PATTERNS[clause_type]
+    patterns = _COMPILED_PATTERNS[clause_type]
 
     match_count = 0
     for pattern in patterns:
-        if re.search(pattern, text_lower, re.IGNORECASE):
+        if pattern.search(text_lower):
             match_count += 1
 
     # Normalize confidence
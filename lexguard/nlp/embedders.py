@@ -1,8 +1,21 @@
 """Text embedding utilities."""
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import hashlib
 import logging
+import multiprocessing
 import os
-from typing import List
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
 
 from lexguard.config import settings
 
@@ -15,11 +28,168 @@ try:
 except ImportError:
     HAS_SENTENCE_TRANSFORMERS = False
 
+# Optional fast non-cryptographic hash for the lightweight embedding
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+if settings.simple_embedding_hash == "xxh3" and not HAS_XXHASH:
+    logger.warning("SIMPLE_EMBEDDING_HASH=xxh3 but xxhash is not installed; using sha256")
+
+# Optional on-disk embedding cache that survives process restarts
+try:
+    import diskcache
+    HAS_DISKCACHE = True
+except ImportError:
+    HAS_DISKCACHE = False
+
 # Default local-friendly model for sentence-transformers
 DEFAULT_ST_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
 
-# Cache for embedding model
-_embedding_model = None
+# Mini-batch size for SentenceTransformer.encode
+ST_BATCH_SIZE = 64
+
+# Token-length bucket upper bounds and the batch size used for each bucket
+# (the last size is for texts longer than the final bound)
+ST_LENGTH_BUCKETS = (32, 64, 128, 256)
+ST_BUCKET_BATCH_SIZES = (256, 128, 64, 32, 16)
+
+# Texts are cut to this many characters before local/Ollama encoding; the
+# models truncate to their max sequence length anyway, but would still
+# tokenize the full text first. Longer clauses should be chunked by callers.
+EMBEDDING_MAX_CHARS = 2000
+
+# OpenAI embeddings request limits and client-side parallelism
+OPENAI_MAX_BATCH_ITEMS = 2048
+OPENAI_MAX_BATCH_TOKENS = 250_000
+OPENAI_MAX_WORKERS = 8
+
+# Batch size from which the lightweight embedder fans out to worker
+# processes (~50us per text, so smaller batches don't amortize the IPC)
+SIMPLE_EMBEDDING_PROCESS_MIN = 512
+SIMPLE_EMBEDDING_MAX_PROCESSES = 8
+
+# Gemini batchEmbedContents accepts at most 100 texts per request
+GEMINI_MAX_BATCH_ITEMS = 100
+
+# TEI's default --max-client-batch-size
+TEI_MAX_BATCH_SIZE = 32
+
+# Where graph-optimized ONNX exports are cached (EMBEDDING_BACKEND=onnx)
+ONNX_CACHE_DIR = Path.home() / ".cache" / "lexguard" / "onnx"
+ONNX_OPTIMIZATION_LEVEL = "O3"
+
+# Whether the one-time truncation warning has been logged
+_truncation_warned = False
+
+# Feature vocabularies for the lightweight embedding. The vector layout is
+# [chars | words | 128 hash dims | zero padding] and must stay stable so that
+# vectors already stored in ChromaDB remain comparable.
+SIMPLE_EMBEDDING_DIM = 384
+_COMMON_CHARS = "abcdefghijklmnopqrstuvwxyz0123456789 .,!?;:()[]{}-"
+_COMMON_WORDS = [
+    "the", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by",
+    "from", "as", "is", "are", "was", "were", "be", "been", "have", "has", "had",
+    "do", "does", "did", "will", "would", "should", "could", "may", "might", "must",
+    "can", "this", "that", "these", "those", "a", "an", "not", "no", "yes",
+]
+_CHAR_SLICE = slice(0, len(_COMMON_CHARS))
+_WORD_SLICE = slice(_CHAR_SLICE.stop, _CHAR_SLICE.stop + len(_COMMON_WORDS))
+_HASH_OFFSET = _WORD_SLICE.stop
+
+# Byte -> char-feature index (-1 for bytes outside the vocabulary)
+_CHAR_LUT = np.full(256, -1, dtype=np.int16)
+_CHAR_LUT[np.frombuffer(_COMMON_CHARS.encode("ascii"), dtype=np.uint8)] = np.arange(
+    len(_COMMON_CHARS)
+)
+_WORD_IDX = {word: i for i, word in enumerate(_COMMON_WORDS)}
+_WORD_RE = re.compile(r"\b\w+\b")
+# Bytes of hash output used as features (the SHA-256 digest size)
+_HASH_FEATURE_BYTES = 32
+
+# In-process LRU cache of computed embeddings (float32 vectors), keyed on
+# provider/model/text hash
+EMBEDDING_CACHE_SIZE = 4096
+_embedding_cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+# Embeddings are requested from worker threads; reordering and eviction must
+# not interleave
+_embedding_cache_lock = threading.Lock()
+# Per-thread flag set when a provider answers through its fallback. Those
+# vectors come from a different model than the cache key names, so they are
+# never cached.
+_fallback_state = threading.local()
+_disk_cache = None  # False once found unavailable
+
+
+def _get_disk_cache():
+    """Return the persistent embedding cache, or None when disabled."""
+    global _disk_cache
+
+    if not settings.embedding_disk_cache or _disk_cache is False:
+        return None
+
+    if _disk_cache is None:
+        if not HAS_DISKCACHE:
+            logger.warning("EMBEDDING_DISK_CACHE is enabled but diskcache is not installed")
+            _disk_cache = False
+            return None
+        _disk_cache = diskcache.Cache(str(settings.data_dir / "embedding_cache"))
+    return _disk_cache
+
+
+def _embedding_cache_key(text: str) -> str:
+    """Build a cache key for text under the active provider and model."""
+    provider = settings.embedding_provider
+    if provider == "chromadb":
+        model = f"simple-{settings.simple_embedding_hash}"
+    else:
+        model = settings.embedding_model
+    digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+    return f"{provider}|{model}|{digest}"
+
+
+def _cache_get(key: str) -> Optional[np.ndarray]:
+    """Return a cached embedding and mark it as recently used."""
+    with _embedding_cache_lock:
+        embedding = _embedding_cache.get(key)
+        if embedding is not None:
+            _embedding_cache.move_to_end(key)
+            return embedding
+
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        embedding = disk_cache.get(key)
+        if embedding is not None:
+            _remember(key, embedding)
+    return embedding
+
+
+def _remember(key: str, embedding: np.ndarray) -> None:
+    """Store an embedding in memory, evicting the least recently used entry."""
+    with _embedding_cache_lock:
+        _embedding_cache[key] = embedding
+        _embedding_cache.move_to_end(key)
+        if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+            _embedding_cache.popitem(last=False)
+
+
+def _cache_put(key: str, embedding: np.ndarray) -> None:
+    """Store an embedding in memory and, if enabled, on disk."""
+    _remember(key, embedding)
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.set(key, embedding)
+
+
+def clear_embedding_cache() -> None:
+    """Drop all cached embeddings (useful after changing provider or model)."""
+    with _embedding_cache_lock:
+        _embedding_cache.clear()
+    disk_cache = _get_disk_cache()
+    if disk_cache is not None:
+        disk_cache.clear()
 
 
 def _resolve_sentence_transformer_model_name() -> str:
@@ -33,50 +203,235 @@ def _resolve_sentence_transformer_model_name() -> str:
 def get_embedding(text: str) -> List[float]:
     """
     Generate embedding vector for text.
+
+    Results are cached, so repeated queries skip the provider entirely.
     """
     provider = settings.embedding_provider
-    logger.info(f"Generating embedding using provider: '{provider}'")
-    
-    if provider == "ollama":
-        return _get_ollama_embedding(text)
-    elif provider == "openai":
-        return _get_openai_embedding(text)
-    elif provider == "gemini":
-        return _get_gemini_embedding(text)
-    elif provider == "sentence-transformers" and HAS_SENTENCE_TRANSFORMERS:
-        return _get_sentence_transformer_embedding(text)
-    elif provider == "chromadb" or provider == "sentence-transformers":
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Generating embedding using provider: '{provider}'")
+
+    key = _embedding_cache_key(text)
+    embedding = _cache_get(key)
+    if embedding is None:
+        _fallback_state.used = False
+        embedding = np.asarray(_embed_with_provider(provider, text), dtype=np.float32)
+        if embedding.size and not _fallback_state.used:
+            _cache_put(key, embedding)
+    return embedding.tolist()
+
+
+def _resolve_provider(provider: str) -> str:
+    """Map the configured provider to a registered one, applying fallbacks."""
+    if provider == "sentence-transformers" and not HAS_SENTENCE_TRANSFORMERS:
         # Use ChromaDB's default embedding function (lightweight)
-        return _get_chromadb_embedding(text)
-    else:
+        return "chromadb"
+    if provider not in _PROVIDERS:
         # Default to ChromaDB embeddings (lightweight, no heavy dependencies)
         logger.warning(f"Unknown provider '{provider}'. Using ChromaDB default embeddings.")
-        return _get_chromadb_embedding(text)
+        return "chromadb"
+    return provider
 
 
-def _get_sentence_transformer_embedding(text: str) -> List[float]:
-    """Get embedding using SentenceTransformers."""
-    global _embedding_model
+def _embed_with_provider(provider: str, text: str) -> List[float]:
+    """Dispatch a single text to the configured embedding provider."""
+    embed_single, _ = _PROVIDERS[_resolve_provider(provider)]
+    return embed_single(text)
+
+
+def _truncate_texts(texts: List[str]) -> List[str]:
+    """Cut texts to EMBEDDING_MAX_CHARS, warning once per process."""
+    global _truncation_warned
+
+    if all(len(text) <= EMBEDDING_MAX_CHARS for text in texts):
+        return texts
+
+    if not _truncation_warned:
+        logger.warning(
+            f"Truncating texts longer than {EMBEDDING_MAX_CHARS} characters before embedding"
+        )
+        _truncation_warned = True
+    return [text[:EMBEDDING_MAX_CHARS] for text in texts]
+
+
+def _resolve_embedding_device() -> str:
+    """Pick the device for sentence-transformers, honouring EMBEDDING_DEVICE."""
+    if settings.embedding_device:
+        return settings.embedding_device
+
+    import torch
+
+    if torch.cuda.is_available():
+        return "cuda"
+    if torch.backends.mps.is_available():
+        return "mps"
+    return "cpu"
 
+
+def _ensure_onnx_cached(model_name: str) -> Path:
+    """
+    Export an optimized ONNX copy of the model once and return its directory.
+
+    The first call saves the model and an ONNX Runtime graph with operator
+    fusion and constant folding applied; later processes load it directly.
+    """
+    target = ONNX_CACHE_DIR / model_name.replace("/", "__")
+    onnx_file = target / "onnx" / f"model_{ONNX_OPTIMIZATION_LEVEL}.onnx"
+    if onnx_file.exists():
+        return target
+
+    from sentence_transformers import SentenceTransformer, export_optimized_onnx_model
+
+    logger.info(f"Exporting optimized ONNX model for {model_name} to {target}")
+    model = SentenceTransformer(model_name, backend="onnx")
+    model.save(str(target))
+    export_optimized_onnx_model(model, ONNX_OPTIMIZATION_LEVEL, str(target))
+    return target
+
+
+def _load_onnx_sentence_transformer(model_name: str):
+    """Load the cached, optimized ONNX Runtime variant of a model."""
+    from sentence_transformers import SentenceTransformer
+
+    model_dir = _ensure_onnx_cached(model_name)
+    return SentenceTransformer(
+        str(model_dir),
+        backend="onnx",
+        model_kwargs={
+            "file_name": f"onnx/model_{ONNX_OPTIMIZATION_LEVEL}.onnx",
+            "provider": "CPUExecutionProvider",
+        },
+    )
+
+
+def _get_sentence_transformer_model():
+    """Return the SentenceTransformer model for the configured model name."""
     if not HAS_SENTENCE_TRANSFORMERS:
         raise ImportError("sentence_transformers is not installed")
 
-    if _embedding_model is None:
-        model_name = _resolve_sentence_transformer_model_name()
-        logger.info(f"Loading embedding model: {model_name}")
-        from sentence_transformers import SentenceTransformer
+    return _get_st_model(_resolve_sentence_transformer_model_name())
 
-        _embedding_model = SentenceTransformer(model_name)
 
-    embedding = _embedding_model.encode(text, convert_to_tensor=False)
-    return embedding.tolist()
+@functools.lru_cache(maxsize=2)
+def _get_st_model(model_name: str):
+    """
+    Load and memoize a SentenceTransformer model by name.
+
+    At most two models stay resident, so switching the embedding model at
+    runtime does not accumulate weights in RAM/VRAM. Weights are read from
+    the local Hugging Face cache, which prefers safetensors files; those are
+    memory-mapped, so repeated processes share pages through the OS cache.
+    """
+    if settings.embedding_backend == "onnx":
+        logger.info(f"Loading embedding model: {model_name} (ONNX Runtime)")
+        try:
+            return _load_onnx_sentence_transformer(model_name)
+        except Exception as e:
+            logger.warning(f"ONNX backend unavailable, using PyTorch: {e}")
+
+    device = _resolve_embedding_device()
+    logger.info(f"Loading embedding model: {model_name} on {device}")
+    from sentence_transformers import SentenceTransformer
+
+    # Pass the device to the constructor so the model's target device stays in sync
+    model = SentenceTransformer(model_name, device=device)
+    if device == "cuda":
+        # fp16 weights halve GPU memory and use tensor cores
+        model.half()
+    return model
+
+
+def _encode_sentence_transformer(texts: List[str]):
+    """
+    Encode texts with SentenceTransformers and return a (N, D) numpy array.
+
+    Large inputs are split into token-length buckets and each bucket is
+    encoded with its own batch size (big batches for short clauses, small
+    ones for long clauses), which bounds padding waste inside every batch.
+    The output stays on the model device until all buckets are done and is
+    copied to host memory once. On CUDA the forward pass runs under fp16
+    autocast. Embeddings are L2-normalized by the model.
+    """
+    import torch
 
+    texts = _truncate_texts(texts)
+    model = _get_sentence_transformer_model()
+    device_type = model.device.type
 
-def _get_openai_embedding(text: str) -> List[float]:
-    """Get embedding using OpenAI API."""
+    autocast = (
+        torch.autocast(device_type="cuda", dtype=torch.float16)
+        if device_type == "cuda"
+        else contextlib.nullcontext()
+    )
+    with torch.inference_mode(), autocast:
+        if len(texts) <= ST_BATCH_SIZE:
+            embeddings = model.encode(
+                texts,
+                batch_size=ST_BATCH_SIZE,
+                convert_to_tensor=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+        else:
+            embeddings = _encode_in_length_buckets(model, texts)
+
+    return embeddings.float().cpu().numpy()
+
+
+def _encode_in_length_buckets(model, texts: List[str]):
+    """Encode texts bucket by bucket and restore the input order on device."""
+    import torch
+
+    lengths = model.tokenizer(texts, truncation=True, return_length=True)["length"]
+    bucket_ids = np.searchsorted(ST_LENGTH_BUCKETS, lengths)
+
+    parts = []
+    order = []
+    for bucket, batch_size in enumerate(ST_BUCKET_BATCH_SIZES):
+        indices = np.flatnonzero(bucket_ids == bucket)
+        if indices.size == 0:
+            continue
+        parts.append(
+            model.encode(
+                [texts[i] for i in indices],
+                batch_size=batch_size,
+                convert_to_tensor=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+        )
+        order.append(indices)
+
+    embeddings = torch.cat(parts)
+    permutation = np.concatenate(order)
+    inverse = np.empty_like(permutation)
+    inverse[permutation] = np.arange(permutation.size)
+    return embeddings[torch.as_tensor(inverse, device=embeddings.device)]
+
+
+def _get_sentence_transformer_embedding(text: str) -> List[float]:
+    """Get embedding using SentenceTransformers."""
+    return _encode_sentence_transformer([text])[0].tolist()
+
+
+@functools.lru_cache(maxsize=1)
+def _get_openai_client():
+    """Return a shared OpenAI client so connections and TLS sessions are reused."""
     from openai import OpenAI
 
-    client = OpenAI(api_key=settings.openai_api_key)
+    return OpenAI(api_key=settings.openai_api_key)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_gemini_client(model_name: str):
+    """Return a memoized Gemini embeddings client for a model."""
+    from lexguard.llm.gemini_client import get_gemini_embeddings
+
+    return get_gemini_embeddings(model_name=model_name)
+
+
+def _get_openai_embedding(text: str) -> List[float]:
+    """Get embedding using OpenAI API."""
+    client = _get_openai_client()
 
     response = client.embeddings.create(
         model="text-embedding-3-small",
@@ -90,6 +445,7 @@ def _get_ollama_embedding(text: str) -> List[float]:
     """Get embedding using Ollama."""
     import httpx
     
+    text = _truncate_texts([text])[0]
     model = settings.embedding_model or "nomic-embed-text"
     base_url = settings.ollama_base_url
     
@@ -108,6 +464,7 @@ def _get_ollama_embedding(text: str) -> List[float]:
     except httpx.ConnectError:
         logger.error("Could not connect to Ollama. Falling back to sentence-transformers.")
         if HAS_SENTENCE_TRANSFORMERS:
+            _fallback_state.used = True
             return _get_sentence_transformer_embedding(text)
         raise ConnectionError(
             "Ollama is not running and sentence-transformers not available. "
@@ -117,15 +474,14 @@ def _get_ollama_embedding(text: str) -> List[float]:
         logger.error(f"Ollama embedding error: {e}")
         if HAS_SENTENCE_TRANSFORMERS:
             logger.warning("Falling back to sentence-transformers.")
+            _fallback_state.used = True
             return _get_sentence_transformer_embedding(text)
         raise
 
 
 def _get_gemini_embedding(text: str) -> List[float]:
     """Get embedding using Google Gemini."""
-    from lexguard.llm.gemini_client import get_gemini_embeddings
-    
-    embeddings = get_gemini_embeddings(model_name=settings.embedding_model)
+    embeddings = _get_gemini_client(settings.embedding_model)
     return embeddings.embed_query(text)
 
 
@@ -133,83 +489,141 @@ def get_embeddings_batch(texts: List[str]) -> List[List[float]]:
     """
     Generate embeddings for multiple texts efficiently.
     """
+    return get_embeddings_batch_np(texts).tolist()
+
+
+def get_embeddings_batch_np(texts: List[str]) -> np.ndarray:
+    """
+    Generate embeddings for multiple texts as a contiguous (N, D) float32 array.
+
+    Identical texts (boilerplate, signature blocks) are embedded once and
+    previously seen texts are served from the in-process cache, so the
+    provider only receives unique cache misses.
+
+    Args:
+        texts: Texts to embed
+
+    Returns:
+        Embedding matrix in input order
+    """
     provider = settings.embedding_provider
-    logger.info(f"Generating batch embeddings using provider: '{provider}'")
-
-    if provider == "ollama":
-        return _get_ollama_embeddings_batch(texts)
-    elif provider == "openai":
-        return _get_openai_embeddings_batch(texts)
-    elif provider == "gemini":
-        return _get_gemini_embeddings_batch(texts)
-    elif provider == "sentence-transformers" and HAS_SENTENCE_TRANSFORMERS:
-        return _get_sentence_transformer_embeddings_batch(texts)
-    elif provider == "chromadb" or provider == "sentence-transformers":
-        # Use ChromaDB's default embedding function (lightweight)
-        return _get_chromadb_embeddings_batch(texts)
-    else:
-        # Default to ChromaDB embeddings (lightweight, no heavy dependencies)
-        logger.warning(f"Unknown provider '{provider}'. Using ChromaDB default embeddings.")
-        return _get_chromadb_embeddings_batch(texts)
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(f"Generating batch embeddings using provider: '{provider}'")
+
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+
+    # Deduplicate while keeping first-seen order
+    unique_index: Dict[str, int] = {}
+    for text in texts:
+        unique_index.setdefault(text, len(unique_index))
+    unique_texts = list(unique_index)
+
+    keys = [_embedding_cache_key(text) for text in unique_texts]
+    unique_embeddings: List[Optional[np.ndarray]] = [_cache_get(key) for key in keys]
+    missing = [i for i, emb in enumerate(unique_embeddings) if emb is None]
+
+    if missing:
+        _fallback_state.used = False
+        computed = np.asarray(
+            _embed_batch_with_provider(provider, [unique_texts[i] for i in missing]),
+            dtype=np.float32,
+        )
+        used_fallback = _fallback_state.used
+        for i, embedding in zip(missing, computed):
+            unique_embeddings[i] = embedding
+            if embedding.size and not used_fallback:
+                _cache_put(keys[i], embedding)
 
+    # Scatter unique rows back to input order in one gather
+    return np.stack(unique_embeddings)[[unique_index[text] for text in texts]]
 
-def _get_sentence_transformer_embeddings_batch(texts: List[str]) -> List[List[float]]:
-    """Get embeddings in batch using SentenceTransformers."""
-    global _embedding_model
 
-    if not HAS_SENTENCE_TRANSFORMERS:
-        raise ImportError("sentence_transformers is not installed")
+def _embed_batch_with_provider(
+    provider: str, texts: List[str]
+) -> Union[np.ndarray, List[List[float]]]:
+    """Dispatch a batch of texts to the configured embedding provider."""
+    _, embed_batch = _PROVIDERS[_resolve_provider(provider)]
+    return embed_batch(texts)
 
-    if _embedding_model is None:
-        model_name = _resolve_sentence_transformer_model_name()
-        logger.info(f"Loading embedding model: {model_name}")
-        from sentence_transformers import SentenceTransformer
 
-        _embedding_model = SentenceTransformer(model_name)
+def _get_sentence_transformer_embeddings_batch(texts: List[str]) -> np.ndarray:
+    """Get embeddings in batch using SentenceTransformers."""
+    return _encode_sentence_transformer(texts).astype(np.float32, copy=False)
+
+
+def _chunk_by_tokens(
+    texts: List[str],
+    max_items: int = OPENAI_MAX_BATCH_ITEMS,
+    max_tokens: int = OPENAI_MAX_BATCH_TOKENS,
+) -> List[List[str]]:
+    """Split texts into request-sized chunks within the OpenAI item and token limits."""
+    encoding = _get_token_encoding()
+
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    current_tokens = 0
+    for text in texts:
+        tokens = _count_tokens(text, encoding)
+        if current and (len(current) >= max_items or current_tokens + tokens > max_tokens):
+            chunks.append(current)
+            current, current_tokens = [], 0
+        current.append(text)
+        current_tokens += tokens
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def _get_token_encoding():
+    """Return the cl100k_base tiktoken encoding, or None when tiktoken is unavailable."""
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base")
 
-    embeddings = _embedding_model.encode(texts, convert_to_tensor=False)
-    return [emb.tolist() for emb in embeddings]
+
+def _count_tokens(text: str, encoding) -> int:
+    """Count tokens in text with the given encoding."""
+    if encoding is None:
+        # Rough estimate (~4 characters per token) when tiktoken is unavailable
+        return len(text) // 4 + 1
+    return len(encoding.encode(text, disallowed_special=()))
 
 
 def _get_openai_embeddings_batch(texts: List[str]) -> List[List[float]]:
     """Get embeddings in batch using OpenAI API."""
-    from openai import OpenAI
+    client = _get_openai_client()
 
-    client = OpenAI(api_key=settings.openai_api_key)
+    def embed_chunk(chunk: List[str]) -> List[List[float]]:
+        response = client.embeddings.create(model="text-embedding-3-small", input=chunk)
+        return [item.embedding for item in response.data]
 
-    response = client.embeddings.create(
-        model="text-embedding-3-small", input=texts
-    )
+    chunks = _chunk_by_tokens(texts)
+    if len(chunks) <= 1:
+        return embed_chunk(chunks[0]) if chunks else []
 
-    return [item.embedding for item in response.data]
+    # Send chunks concurrently; map() keeps results in input order
+    with ThreadPoolExecutor(max_workers=min(OPENAI_MAX_WORKERS, len(chunks))) as executor:
+        return [emb for chunk_embs in executor.map(embed_chunk, chunks) for emb in chunk_embs]
 
 
 def _get_ollama_embeddings_batch(texts: List[str]) -> List[List[float]]:
     """Get embeddings in batch using Ollama."""
     import httpx
     
+    texts = _truncate_texts(texts)
     model = settings.embedding_model or "nomic-embed-text"
     base_url = settings.ollama_base_url
     
     try:
-        # Ollama processes one at a time for embeddings
-        embeddings = []
-        with httpx.Client(timeout=60.0) as client:
-            for text in texts:
-                response = client.post(
-                    f"{base_url}/api/embeddings",
-                    json={
-                        "model": model,
-                        "prompt": text,
-                    },
-                )
-                response.raise_for_status()
-                result = response.json()
-                embeddings.append(result.get("embedding", []))
-        return embeddings
+        # Ollama embeds one prompt per request, so overlap the requests
+        return _run_coroutine(_gather_ollama_embeddings(texts, model, base_url))
     except httpx.ConnectError:
         logger.error("Could not connect to Ollama. Falling back to sentence-transformers.")
         if HAS_SENTENCE_TRANSFORMERS:
+            _fallback_state.used = True
             return _get_sentence_transformer_embeddings_batch(texts)
         raise ConnectionError(
             "Ollama is not running and sentence-transformers not available. "
@@ -219,16 +633,92 @@ def _get_ollama_embeddings_batch(texts: List[str]) -> List[List[float]]:
         logger.error(f"Ollama embedding error: {e}")
         if HAS_SENTENCE_TRANSFORMERS:
             logger.warning("Falling back to sentence-transformers.")
+            _fallback_state.used = True
             return _get_sentence_transformer_embeddings_batch(texts)
         raise
 
 
+async def _gather_ollama_embeddings(
+    texts: List[str], model: str, base_url: str
+) -> List[List[float]]:
+    """Request Ollama embeddings concurrently over a pooled connection."""
+    import httpx
+
+    concurrency = max(1, settings.ollama_concurrency)
+    semaphore = asyncio.Semaphore(concurrency)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(timeout=60.0, limits=limits) as client:
+
+        async def embed_one(text: str) -> List[float]:
+            async with semaphore:
+                response = await client.post(
+                    f"{base_url}/api/embeddings",
+                    json={
+                        "model": model,
+                        "prompt": text,
+                    },
+                )
+                response.raise_for_status()
+                return response.json().get("embedding", [])
+
+        return await asyncio.gather(*(embed_one(text) for text in texts))
+
+
+def _run_coroutine(coro):
+    """Run a coroutine to completion, even when called from inside an event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    # Called from async code (e.g. a FastAPI handler): use a separate loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
 def _get_gemini_embeddings_batch(texts: List[str]) -> List[List[float]]:
-    """Get embeddings in batch using Google Gemini."""
-    from lexguard.llm.gemini_client import get_gemini_embeddings
-    
-    embeddings = get_gemini_embeddings(model_name=settings.embedding_model)
-    return embeddings.embed_documents(texts)
+    """Get embeddings in batch using Google Gemini (synchronous batchEmbedContents requests)."""
+    embeddings = _get_gemini_client(settings.embedding_model)
+    return embeddings.embed_documents_bulk(texts, batch_size=GEMINI_MAX_BATCH_ITEMS)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_tei_client():
+    """Return a pooled HTTP client for the Text-Embeddings-Inference server."""
+    import httpx
+
+    return httpx.Client(base_url=settings.tei_base_url, timeout=60.0)
+
+
+def _get_tei_embedding(text: str) -> List[float]:
+    """Get embedding from a Text-Embeddings-Inference server."""
+    return _get_tei_embeddings_batch([text])[0]
+
+
+def _get_tei_embeddings_batch(texts: List[str]) -> List[List[float]]:
+    """
+    Get embeddings from a Hugging Face Text-Embeddings-Inference (TEI) server.
+
+    TEI tokenizes and batches server-side with padding-free attention kernels.
+    Start one with, for example:
+
+        docker run --gpus all -p 8080:80 \\
+            ghcr.io/huggingface/text-embeddings-inference:latest \\
+            --model-id sentence-transformers/all-MiniLM-L6-v2
+
+    and set EMBEDDING_PROVIDER=tei and TEI_BASE_URL=http://localhost:8080.
+    """
+    client = _get_tei_client()
+
+    embeddings: List[List[float]] = []
+    for start in range(0, len(texts), TEI_MAX_BATCH_SIZE):
+        response = client.post(
+            "/embed", json={"inputs": texts[start : start + TEI_MAX_BATCH_SIZE]}
+        )
+        response.raise_for_status()
+        embeddings.extend(response.json())
+    return embeddings
 
 
 def _get_chromadb_embedding(text: str) -> List[float]:
@@ -236,12 +726,65 @@ def _get_chromadb_embedding(text: str) -> List[float]:
     return _get_simple_embedding(text)
 
 
-def _get_chromadb_embeddings_batch(texts: List[str]) -> List[List[float]]:
-    """Get embeddings in batch using lightweight approach."""
-    return [_get_simple_embedding(text) for text in texts]
+def _get_chromadb_embeddings_batch(texts: List[str]) -> np.ndarray:
+    """
+    Get embeddings in batch using lightweight approach.
+
+    Large batches are spread over worker processes on multi-core hosts,
+    since the per-text work is pure Python and GIL-bound.
+    """
+    if len(texts) >= SIMPLE_EMBEDDING_PROCESS_MIN and (os.cpu_count() or 1) > 1:
+        pool = _get_simple_embedding_pool()
+        rows = list(pool.map(_simple_embedding_array, texts, chunksize=64))
+        return np.asarray(rows, dtype=np.float32)
+
+    embeddings = np.empty((len(texts), SIMPLE_EMBEDDING_DIM), dtype=np.float32)
+    for i, text in enumerate(texts):
+        embeddings[i] = _simple_embedding_array(text)
+    return embeddings
+
+
+@functools.lru_cache(maxsize=1)
+def _get_simple_embedding_pool() -> ProcessPoolExecutor:
+    """
+    Return the worker pool for large lightweight-embedding batches.
+
+    Created on first use and reused across calls. Workers are spawned rather
+    than forked, so they don't inherit the server's ChromaDB client, held
+    locks or loaded models.
+    """
+    workers = min(SIMPLE_EMBEDDING_MAX_PROCESSES, os.cpu_count() or 1)
+    logger.info(f"Starting {workers} lightweight-embedding worker processes")
+    return ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+@atexit.register
+def _shutdown_simple_embedding_pool() -> None:
+    """Stop the lightweight-embedding workers, if they were started."""
+    if _get_simple_embedding_pool.cache_info().currsize:
+        _get_simple_embedding_pool().shutdown()
+        _get_simple_embedding_pool.cache_clear()
+
+
+def _feature_hash(data: bytes) -> bytes:
+    """Return the pseudo-random bytes used as hash features."""
+    algorithm = settings.simple_embedding_hash
+    if algorithm == "blake2b":
+        return hashlib.blake2b(data, digest_size=_HASH_FEATURE_BYTES).digest()
+    if algorithm == "xxh3" and HAS_XXHASH:
+        first = xxhash.xxh3_128(data).digest()
+        return first + xxhash.xxh3_128(first).digest()
+    return hashlib.sha256(data).digest()
 
 
 def _get_simple_embedding(text: str) -> List[float]:
+    """Simple lightweight embedding as a plain list (see _simple_embedding_array)."""
+    return _simple_embedding_array(text).tolist()
+
+
+def _simple_embedding_array(text: str) -> np.ndarray:
     """
     Simple lightweight embedding using text features (no ML models, no heavy dependencies).
     
@@ -251,46 +794,43 @@ def _get_simple_embedding(text: str) -> List[float]:
     - Hash-based features
     
     This provides reasonable similarity matching without requiring PyTorch or other heavy libraries.
+    The result is L2-normalized. Counting runs through precomputed lookup tables and NumPy, so the cost is a
+    few C-level passes over the text rather than per-feature dict lookups.
     """
-    import hashlib
-    import re
-    from collections import Counter
-    
-    # Normalize text
     text_lower = text.lower()
-    words = re.findall(r'\b\w+\b', text_lower)
-    chars = list(text_lower)
-    
-    # Create feature vector (384 dimensions)
-    embedding = []
-    
-    # 1. Character frequency features (128 dims)
-    char_freq = Counter(chars)
-    common_chars = 'abcdefghijklmnopqrstuvwxyz0123456789 .,!?;:()[]{}-'
-    for char in common_chars[:128]:
-        embedding.append(char_freq.get(char, 0) / max(len(chars), 1))
-    
-    # 2. Word-based features (128 dims)
-    word_freq = Counter(words)
-    common_words = ['the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by',
-                   'from', 'as', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had',
-                   'do', 'does', 'did', 'will', 'would', 'should', 'could', 'may', 'might', 'must',
-                   'can', 'this', 'that', 'these', 'those', 'a', 'an', 'not', 'no', 'yes']
-    for word in common_words[:128]:
-        embedding.append(word_freq.get(word, 0) / max(len(words), 1))
-    
-    # 3. Hash-based features (128 dims)
-    hash_obj = hashlib.sha256(text.encode())
-    hash_bytes = hash_obj.digest()
-    for i in range(128):
-        if i < len(hash_bytes):
-            embedding.append((hash_bytes[i] - 128) / 128.0)
-        else:
-            embedding.append(0.0)
-    
-    # Ensure exactly 384 dimensions
-    while len(embedding) < 384:
-        embedding.append(0.0)
-    
-    return embedding[:384]
-
+    embedding = np.zeros(SIMPLE_EMBEDDING_DIM, dtype=np.float64)
+
+    # 1. Character frequency features (all vocab chars are ASCII, so UTF-8
+    #    continuation bytes never hit the lookup table)
+    codes = _CHAR_LUT[np.frombuffer(text_lower.encode("utf-8"), dtype=np.uint8)]
+    char_counts = np.bincount(codes[codes >= 0], minlength=len(_COMMON_CHARS))
+    embedding[_CHAR_SLICE] = char_counts / max(len(text_lower), 1)
+
+    # 2. Word-based features
+    words = _WORD_RE.findall(text_lower)
+    word_counts = np.bincount(
+        [_WORD_IDX[word] for word in words if word in _WORD_IDX],
+        minlength=len(_COMMON_WORDS),
+    )
+    embedding[_WORD_SLICE] = word_counts / max(len(words), 1)
+
+    # 3. Hash-based features
+    digest = np.frombuffer(_feature_hash(text.encode()), dtype=np.uint8)
+    embedding[_HASH_OFFSET : _HASH_OFFSET + digest.size] = (digest - 128.0) / 128.0
+
+    # Unit length, so cosine distance in the vector store is a dot product
+    return embedding / (np.linalg.norm(embedding) + 1e-12)
+
+
+# Provider name -> (single-text embedder, batch embedder)
+_PROVIDERS: Dict[str, Tuple[Callable[[str], Any], Callable[[List[str]], Any]]] = {
+    "ollama": (_get_ollama_embedding, _get_ollama_embeddings_batch),
+    "openai": (_get_openai_embedding, _get_openai_embeddings_batch),
+    "gemini": (_get_gemini_embedding, _get_gemini_embeddings_batch),
+    "tei": (_get_tei_embedding, _get_tei_embeddings_batch),
+    "sentence-transformers": (
+        _get_sentence_transformer_embedding,
+        _get_sentence_transformer_embeddings_batch,
+    ),
+    "chromadb": (_get_chromadb_embedding, _get_chromadb_embeddings_batch),
+}
@@ -1,13 +1,26 @@
 """Vector store interface for semantic search."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 
+import numpy as np
+
 from lexguard.models.clause import Clause
-from lexguard.nlp.embedders import get_embedding, get_embeddings_batch
+from lexguard.nlp.embedders import get_embedding, get_embeddings_batch_np
 
 logger = logging.getLogger(__name__)
 
+# Clauses embedded and written per ChromaDB upsert call
+UPSERT_SHARD_SIZE = 128
+
+# Clause collection name. Chroma ignores metadata for an existing collection,
+# so the cosine index with unit-normalized vectors lives under a new name
+# rather than inheriting the legacy L2 "clauses" collection. The API migrates
+# stored contracts on startup; see migrate_legacy_collection().
+CLAUSE_COLLECTION = "clauses_v2"
+LEGACY_CLAUSE_COLLECTION = "clauses"
+
 
 class VectorStore:
     """
@@ -16,7 +29,7 @@ class VectorStore:
     Uses ChromaDB for local storage and retrieval.
     """
 
-    def __init__(self, collection_name: str = "clauses"):
+    def __init__(self, collection_name: str = CLAUSE_COLLECTION):
         """
         Initialize vector store.
 
@@ -31,7 +44,7 @@ class VectorStore:
         # Get or create collection
         self.collection = self.client.get_or_create_collection(
             name=collection_name,
-            metadata={"description": "Legal contract clauses"},
+            metadata={"description": "Legal contract clauses", "hnsw:space": "cosine"},
         )
 
         logger.info(f"Initialized vector store with collection: {collection_name}")
@@ -50,12 +63,51 @@ class VectorStore:
 
         logger.info(f"Upserting {len(clauses)} clauses for contract {contract_id}")
 
-        # Generate embeddings for all clauses
-        texts = [clause.text for clause in clauses]
-        embeddings = get_embeddings_batch(texts)
+        shards = [
+            clauses[start : start + UPSERT_SHARD_SIZE]
+            for start in range(0, len(clauses), UPSERT_SHARD_SIZE)
+        ]
+
+        if len(shards) == 1:
+            self._upsert_shard(shards[0], self._embed_shard(shards[0]))
+        else:
+            # Pipeline the work: embed shard k+1 on a worker thread while
+            # shard k is written to ChromaDB. Only one shard is prefetched,
+            # so memory stays bounded.
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending = executor.submit(self._embed_shard, shards[0])
+                for k, shard in enumerate(shards):
+                    embeddings = pending.result()
+                    if k + 1 < len(shards):
+                        pending = executor.submit(self._embed_shard, shards[k + 1])
+                    self._upsert_shard(shard, embeddings)
+
+        logger.info(f"Successfully upserted {len(clauses)} clauses")
 
+    @staticmethod
+    def _embed_shard(clauses: List[Clause]) -> np.ndarray:
+        """
+        Embed a shard of clauses as one (N, D) float32 buffer.
+
+        Args:
+            clauses: Clauses to embed
+
+        Returns:
+            Embedding matrix; ChromaDB accepts the array directly
+        """
+        return get_embeddings_batch_np([clause.text for clause in clauses])
+
+    def _upsert_shard(self, clauses: List[Clause], embeddings: np.ndarray) -> None:
+        """
+        Write a shard of clauses and their embeddings to ChromaDB.
+
+        Args:
+            clauses: Clauses to store
+            embeddings: Embedding matrix aligned with ``clauses``
+        """
         # Prepare data for ChromaDB
         ids = [clause.id for clause in clauses]
+        texts = [clause.text for clause in clauses]
         metadatas = [
             {
                 "contract_id": clause.contract_id,
@@ -71,8 +123,6 @@ class VectorStore:
             ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas
         )
 
-        logger.info(f"Successfully upserted {len(clauses)} clauses")
-
     def search_similar(
         self, contract_id: str, query: str, k: int = 5
     ) -> List[dict]:
@@ -99,20 +149,15 @@ class VectorStore:
             where={"contract_id": contract_id},
         )
 
-        # Format results
-        search_results = []
-        if results["ids"] and results["ids"][0]:
-            for i in range(len(results["ids"][0])):
-                search_results.append(
-                    {
-                        "id": results["ids"][0][i],
-                        "text": results["documents"][0][i],
-                        "metadata": results["metadatas"][0][i],
-                        "distance": results["distances"][0][i]
-                        if "distances" in results
-                        else None,
-                    }
-                )
+        # Format results (Chroma returns one list per query embedding)
+        ids = (results.get("ids") or [[]])[0]
+        documents = (results.get("documents") or [[]])[0]
+        metadatas = (results.get("metadatas") or [[]])[0]
+        distances = (results.get("distances") or [[]])[0] or [None] * len(ids)
+        search_results = [
+            {"id": clause_id, "text": text, "metadata": metadata, "distance": distance}
+            for clause_id, text, metadata, distance in zip(ids, documents, metadatas, distances)
+        ]
 
         logger.info(f"Found {len(search_results)} similar clauses")
         return search_results
@@ -156,3 +201,67 @@ class VectorStore:
 
         return None
 
+
+def reindex_contracts(vector_store: Optional[VectorStore] = None) -> int:
+    """
+    Re-embed every stored contract into the clause collection.
+
+    The legacy L2 "clauses" collection is dropped once all contracts have
+    been indexed.
+
+    Args:
+        vector_store: Target store (defaults to the current clause collection)
+
+    Returns:
+        Number of clauses indexed
+    """
+    from lexguard.storage.file_store import list_contracts, load_contract
+
+    vector_store = vector_store or VectorStore()
+    indexed = 0
+
+    for metadata in list_contracts():
+        contract = load_contract(metadata.id)
+        if contract and contract.clauses:
+            vector_store.upsert_clauses(contract.id, contract.clauses)
+            indexed += len(contract.clauses)
+
+    logger.info(f"Reindexed {indexed} clauses into '{vector_store.collection_name}'")
+
+    if _has_collection(vector_store.client, LEGACY_CLAUSE_COLLECTION):
+        try:
+            vector_store.client.delete_collection(LEGACY_CLAUSE_COLLECTION)
+            logger.info(f"Dropped legacy collection '{LEGACY_CLAUSE_COLLECTION}'")
+        except Exception as e:
+            logger.warning(f"Could not drop legacy collection '{LEGACY_CLAUSE_COLLECTION}': {e}")
+
+    return indexed
+
+
+def migrate_legacy_collection() -> int:
+    """
+    Reindex stored contracts if the legacy L2 collection is still present.
+
+    Called on API startup. A failed run leaves the legacy collection in
+    place, so the migration is retried on the next start.
+
+    Returns:
+        Number of clauses indexed (0 when there was nothing to migrate)
+    """
+    from lexguard.storage.chroma_store import get_chroma_client
+
+    if not _has_collection(get_chroma_client(), LEGACY_CLAUSE_COLLECTION):
+        return 0
+
+    logger.info(
+        f"Found legacy collection '{LEGACY_CLAUSE_COLLECTION}'; "
+        f"reindexing stored contracts into '{CLAUSE_COLLECTION}'"
+    )
+    return reindex_contracts()
+
+
+def _has_collection(client, name: str) -> bool:
+    """Check whether a ChromaDB collection exists."""
+    # list_collections returns names on chromadb>=0.6 and Collection objects before
+    names = {getattr(collection, "name", collection) for collection in client.list_collections()}
+    return name in names
@@ -1,9 +1,9 @@
 """Report generation modules."""
 
-from lexguard.reports.pdf_report import generate_pdf_report
+from lexguard.reports.pdf_report import generate_pdf_report, generate_pdf_reports_bulk
 from lexguard.reports.summary_builder import build_contract_summary
 
-__all__ = ["generate_pdf_report", "build_contract_summary"]
+__all__ = ["generate_pdf_report", "generate_pdf_reports_bulk", "build_contract_summary"]
 
 
 
@@ -1,29 +1,131 @@
 """PDF report generation for contracts."""
 
+import functools
 import logging
+import os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import List
-
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
-from reportlab.lib.units import inch
-from reportlab.platypus import (
-    PageBreak,
-    Paragraph,
-    SimpleDocTemplate,
-    Spacer,
-    Table,
-    TableStyle,
-)
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
 
 from lexguard.config import settings
 from lexguard.models.contract import Contract
 from lexguard.models.risk import ClauseRisk
 
+if TYPE_CHECKING:
+    from reportlab.platypus import Paragraph
+
 logger = logging.getLogger(__name__)
 
+# ReportLab is imported on first use (see _get_styles), so processes that
+# never render a PDF don't pay for loading it.
+
+# C accelerator for ReportLab's string widths and PDF escaping
+# (pip install "reportlab[accel]"; must be built for the running CPython)
+try:
+    import _rl_accel  # noqa: F401
+
+    HAS_RL_ACCEL = True
+except ImportError:
+    HAS_RL_ACCEL = False
+
+PDF_WRITE_BUFFER_SIZE = 1 << 20
+
+# Clause header colour per risk level (grey for anything else)
+LEVEL_COLORS = {
+    "high": "#dc3545",
+    "medium": "#ffc107",
+    "low": "#28a745",
+}
+DEFAULT_LEVEL_COLOR = "#6c757d"
+
+
+@functools.lru_cache(maxsize=1)
+def _get_styles() -> SimpleNamespace:
+    """
+    Build the report styles (once per process).
+
+    Styles are immutable once built, so every report shares them.
+    """
+    from reportlab.lib import colors
+    from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
+    from reportlab.platypus import TableStyle
+
+    if not HAS_RL_ACCEL:
+        logger.info("rl_accel not installed; ReportLab will use its pure-Python text metrics")
+
+    sample = getSampleStyleSheet()
+    h3 = sample["Heading3"]
+
+    def clause_header(name: str, color: str) -> ParagraphStyle:
+        # Heading3 variant in a risk colour, with room for the ● bullet
+        return ParagraphStyle(
+            f"ClauseHeader{name}",
+            parent=h3,
+            textColor=colors.HexColor(color),
+            bulletFontName=h3.fontName,
+            bulletFontSize=h3.fontSize,
+            leftIndent=14,
+        )
+
+    return SimpleNamespace(
+        body=sample["BodyText"],
+        title=ParagraphStyle(
+            "CustomTitle",
+            parent=sample["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#1a1a1a"),
+            spaceAfter=30,
+            alignment=1,  # Center
+        ),
+        heading=ParagraphStyle(
+            "CustomHeading",
+            parent=sample["Heading2"],
+            fontSize=16,
+            textColor=colors.HexColor("#2c5aa0"),
+            spaceAfter=12,
+            spaceBefore=12,
+        ),
+        header_by_level={
+            level: clause_header(level.title(), color) for level, color in LEVEL_COLORS.items()
+        },
+        header_default=clause_header("Other", DEFAULT_LEVEL_COLOR),
+        info_table=TableStyle(
+            [
+                ("FONT", (0, 0), (0, -1), "Helvetica-Bold", 10),
+                ("FONT", (1, 0), (1, -1), "Helvetica", 10),
+                ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#333333")),
+                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
+                ("VALIGN", (0, 0), (-1, -1), "TOP"),
+                ("LEFTPADDING", (0, 0), (-1, -1), 0),
+                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
+                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+            ]
+        ),
+        risk_table=TableStyle(
+            [
+                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c5aa0")),
+                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
+                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+                ("FONTSIZE", (0, 0), (-1, 0), 12),
+                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
+                ("GRID", (0, 0), (-1, -1), 1, colors.grey),
+                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f5f5f5")]),
+            ]
+        ),
+    )
+
+
+def _bullet_section(heading: str, items: List[str]) -> "Paragraph":
+    """Render a bold heading and its bullet items as a single Paragraph."""
+    from reportlab.platypus import Paragraph
+
+    bullets = "".join(f"<br/>  • {item}" for item in items)
+    return Paragraph(f"<b>{heading}:</b>{bullets}", _get_styles().body)
+
 
 def generate_pdf_report(
     contract: Contract, risks: List[ClauseRisk], summary: str, output_path: Path = None
@@ -47,42 +149,17 @@ def generate_pdf_report(
 
     logger.info(f"Generating PDF report: {output_path}")
 
-    # Create PDF document
-    doc = SimpleDocTemplate(
-        str(output_path),
-        pagesize=letter,
-        rightMargin=0.75 * inch,
-        leftMargin=0.75 * inch,
-        topMargin=0.75 * inch,
-        bottomMargin=0.75 * inch,
-    )
+    from reportlab.lib.units import inch
+    from reportlab.platypus import PageBreak, Paragraph, Spacer, Table
+
+    styles = _get_styles()
 
     # Build content
     story = []
-    styles = getSampleStyleSheet()
-
-    # Custom styles
-    title_style = ParagraphStyle(
-        "CustomTitle",
-        parent=styles["Heading1"],
-        fontSize=24,
-        textColor=colors.HexColor("#1a1a1a"),
-        spaceAfter=30,
-        alignment=1,  # Center
-    )
-
-    heading_style = ParagraphStyle(
-        "CustomHeading",
-        parent=styles["Heading2"],
-        fontSize=16,
-        textColor=colors.HexColor("#2c5aa0"),
-        spaceAfter=12,
-        spaceBefore=12,
-    )
 
     # Title page
     story.append(Spacer(1, 1.5 * inch))
-    story.append(Paragraph("LexGuard Contract Risk Report", title_style))
+    story.append(Paragraph("LexGuard Contract Risk Report", styles.title))
     story.append(Spacer(1, 0.3 * inch))
 
     # Contract info
@@ -94,145 +171,195 @@ def generate_pdf_report(
     ]
 
     info_table = Table(info_data, colWidths=[2 * inch, 4 * inch])
-    info_table.setStyle(
-        TableStyle(
-            [
-                ("FONT", (0, 0), (0, -1), "Helvetica-Bold", 10),
-                ("FONT", (1, 0), (1, -1), "Helvetica", 10),
-                ("TEXTCOLOR", (0, 0), (-1, -1), colors.HexColor("#333333")),
-                ("ALIGN", (0, 0), (-1, -1), "LEFT"),
-                ("VALIGN", (0, 0), (-1, -1), "TOP"),
-                ("LEFTPADDING", (0, 0), (-1, -1), 0),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 0),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
-            ]
-        )
-    )
+    info_table.setStyle(styles.info_table)
     story.append(info_table)
     story.append(PageBreak())
 
     # Executive Summary
-    story.append(Paragraph("Executive Summary", heading_style))
+    story.append(Paragraph("Executive Summary", styles.heading))
     story.append(Spacer(1, 0.1 * inch))
 
     for para in summary.split("\n\n"):
         if para.strip():
-            story.append(Paragraph(para.replace("\n", "<br/>"), styles["BodyText"]))
+            story.append(Paragraph(para.replace("\n", "<br/>"), styles.body))
             story.append(Spacer(1, 0.15 * inch))
 
     story.append(Spacer(1, 0.3 * inch))
 
+    # Nothing to tabulate: finish with the title page and summary
+    if not risks:
+        story.append(Paragraph("No clause risks were assessed for this contract.", styles.body))
+        return _write_pdf(story, output_path)
+
     # Risk Overview
-    story.append(Paragraph("Risk Overview", heading_style))
+    story.append(Paragraph("Risk Overview", styles.heading))
     story.append(Spacer(1, 0.1 * inch))
 
-    risk_counts = {"high": 0, "medium": 0, "low": 0}
-    for risk in risks:
-        if risk.level in risk_counts:
-            risk_counts[risk.level] += 1
+    risk_counts = Counter(risk.level for risk in risks)
 
     risk_data = [
         ["Risk Level", "Count", "Percentage"],
         [
             "🔴 High",
             str(risk_counts["high"]),
-            f"{risk_counts['high'] / len(risks) * 100:.1f}%" if risks else "0%",
+            f"{risk_counts['high'] / len(risks) * 100:.1f}%",
         ],
         [
             "🟡 Medium",
             str(risk_counts["medium"]),
-            f"{risk_counts['medium'] / len(risks) * 100:.1f}%" if risks else "0%",
+            f"{risk_counts['medium'] / len(risks) * 100:.1f}%",
         ],
         [
             "🟢 Low",
             str(risk_counts["low"]),
-            f"{risk_counts['low'] / len(risks) * 100:.1f}%" if risks else "0%",
+            f"{risk_counts['low'] / len(risks) * 100:.1f}%",
         ],
     ]
 
     risk_table = Table(risk_data, colWidths=[2 * inch, 1 * inch, 1.5 * inch])
-    risk_table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#2c5aa0")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("ALIGN", (0, 0), (-1, -1), "CENTER"),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 12),
-                ("BOTTOMPADDING", (0, 0), (-1, 0), 12),
-                ("GRID", (0, 0), (-1, -1), 1, colors.grey),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.white, colors.HexColor("#f5f5f5")]),
-            ]
-        )
-    )
+    risk_table.setStyle(styles.risk_table)
     story.append(risk_table)
     story.append(PageBreak())
 
     # Detailed Clause Analysis
-    story.append(Paragraph("Detailed Clause Analysis", heading_style))
+    story.append(Paragraph("Detailed Clause Analysis", styles.heading))
     story.append(Spacer(1, 0.2 * inch))
 
-    # Sort by risk level
-    sorted_risks = sorted(
-        risks, key=lambda r: {"high": 0, "medium": 1, "low": 2}.get(r.level, 3)
-    )
+    for section in _clause_sections(contract, risks):
+        story.extend(section)
+
+    return _write_pdf(story, output_path)
+
+
+def _clause_sections(contract: Contract, risks: List[ClauseRisk]) -> Iterator[list]:
+    """Yield the flowables of each clause section, highest risk first."""
+    from reportlab.lib.units import inch
+    from reportlab.platypus import Paragraph, Spacer
+
+    styles = _get_styles()
+
+    # Order by risk level (high, medium, low, other) with one stable pass
+    buckets = {"high": [], "medium": [], "low": [], None: []}
+    for risk in risks:
+        buckets.get(risk.level, buckets[None]).append(risk)
+    sorted_risks = buckets["high"] + buckets["medium"] + buckets["low"] + buckets[None]
+
+    clauses_by_id = {c.id: c for c in contract.clauses}
 
     for i, risk in enumerate(sorted_risks, 1):
         # Find corresponding clause
-        clause = next((c for c in contract.clauses if c.id == risk.clause_id), None)
+        clause = clauses_by_id.get(risk.clause_id)
         if not clause:
             continue
 
-        # Risk level indicator
-        level_colors = {
-            "high": "#dc3545",
-            "medium": "#ffc107",
-            "low": "#28a745",
-        }
-        level_text = risk.level.upper()
-        level_color = level_colors.get(risk.level, "#6c757d")
+        section = []
 
-        # Clause header
+        # Clause header, coloured by risk level through its style
         if hasattr(clause.clause_type, "value"):
             type_str = clause.clause_type.value
         else:
             type_str = str(clause.clause_type)
-            
+
         clause_title = f"Clause {i}: {type_str.replace('_', ' ').title()}"
-        story.append(
+        section.append(
             Paragraph(
-                f'<font color="{level_color}">● </font><b>{clause_title}</b> '
-                f'<font color="{level_color}">[{level_text}]</font>',
-                styles["Heading3"],
+                f"{clause_title} [{risk.level.upper()}]",
+                styles.header_by_level.get(risk.level, styles.header_default),
+                bulletText="●",
             )
         )
-        story.append(Spacer(1, 0.1 * inch))
+        section.append(Spacer(1, 0.1 * inch))
 
         # Clause text (truncated)
         clause_text = clause.text[:300] + "..." if len(clause.text) > 300 else clause.text
-        story.append(Paragraph(f"<i>{clause_text}</i>", styles["BodyText"]))
-        story.append(Spacer(1, 0.1 * inch))
+        section.append(Paragraph(f"<i>{clause_text}</i>", styles.body))
+        section.append(Spacer(1, 0.1 * inch))
 
-        # Risk reasons
+        # Risk reasons (heading and top 3 bullets in one Paragraph)
         if risk.reasons:
-            story.append(Paragraph("<b>Risk Factors:</b>", styles["BodyText"]))
-            for reason in risk.reasons[:3]:  # Limit to top 3
-                story.append(Paragraph(f"  • {reason}", styles["BodyText"]))
-            story.append(Spacer(1, 0.1 * inch))
+            section.append(_bullet_section("Risk Factors", risk.reasons[:3]))
+            section.append(Spacer(1, 0.1 * inch))
 
         # Recommendations
         if risk.recommendations:
-            story.append(Paragraph("<b>Recommendations:</b>", styles["BodyText"]))
-            for rec in risk.recommendations[:3]:  # Limit to top 3
-                story.append(Paragraph(f"  • {rec}", styles["BodyText"]))
-
-        story.append(Spacer(1, 0.25 * inch))
-
-    # Build PDF
-    doc.build(story)
+            section.append(_bullet_section("Recommendations", risk.recommendations[:3]))
+
+        section.append(Spacer(1, 0.25 * inch))
+        yield section
+
+
+def _write_pdf(story: list, output_path: Path) -> Path:
+    """Lay out the story and write it to output_path."""
+    from reportlab import rl_config
+    from reportlab.lib.pagesizes import letter
+    from reportlab.lib.units import inch
+    from reportlab.platypus import SimpleDocTemplate
+
+    # Skip ASCII85-encoding compressed streams; reports are served as binary
+    # files. This is a process-wide ReportLab setting, read when the streams
+    # are written.
+    rl_config.useA85 = 0
+
+    # Build PDF through a 1 MiB userspace buffer so output reaches the file
+    # in a few large writes
+    with open(output_path, "wb", buffering=PDF_WRITE_BUFFER_SIZE) as fh:
+        doc = SimpleDocTemplate(
+            fh,
+            pagesize=letter,
+            rightMargin=0.75 * inch,
+            leftMargin=0.75 * inch,
+            topMargin=0.75 * inch,
+            bottomMargin=0.75 * inch,
+        )
+        doc.build(story)
     logger.info(f"PDF report generated: {output_path}")
 
     return output_path
 
 
+def generate_pdf_reports_bulk(
+    items: List[Tuple[Contract, List[ClauseRisk], str]], output_dir: Optional[Path] = None
+) -> List[Path]:
+    """
+    Generate PDF reports for many contracts in parallel worker processes.
+
+    Report layout is CPU-bound pure Python, so reports are spread across
+    processes. Models are sent to workers as plain dicts and rebuilt there.
 
+    Args:
+        items: (contract, risks, summary) tuples, one per report
+        output_dir: Optional output directory (defaults to data/reports/)
+
+    Returns:
+        Paths to the generated PDFs, in input order
+    """
+    if output_dir is None:
+        output_dir = settings.data_dir / "reports"
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    jobs = [
+        (
+            contract.model_dump(mode="json"),
+            [risk.model_dump(mode="json") for risk in risks],
+            summary,
+            str(output_dir / f"report_{contract.id}.pdf"),
+        )
+        for contract, risks, summary in items
+    ]
+
+    cpus = os.cpu_count() or 1
+    if len(jobs) <= 1 or cpus <= 1:
+        return [_generate_pdf_report_job(*job) for job in jobs]
+
+    logger.info(f"Generating {len(jobs)} PDF reports in parallel")
+    with ProcessPoolExecutor(max_workers=min(cpus, len(jobs))) as executor:
+        return list(executor.map(_generate_pdf_report_job, *zip(*jobs)))
+
+
+def _generate_pdf_report_job(
+    contract_data: dict, risks_data: List[dict], summary: str, output_path: str
+) -> Path:
+    """Rebuild models from plain data and generate one report (worker entry point)."""
+    contract = Contract.model_validate(contract_data)
+    risks = [ClauseRisk.model_validate(risk) for risk in risks_data]
+    return generate_pdf_report(contract, risks, summary, Path(output_path))
@@ -1,12 +1,28 @@
 """Contract summary generation."""
 
+import hashlib
 import logging
+import threading
+from collections import Counter, OrderedDict
+from itertools import islice
 from typing import Optional
 
+from lexguard.config import settings
 from lexguard.models.contract import Contract
 
 logger = logging.getLogger(__name__)
 
+# Characters of contract text sent to the LLM for summarization
+LLM_SUMMARY_MAX_CHARS = 8000
+
+# In-process LRU cache of LLM summaries, keyed on prompt, provider, model
+# and a hash of the text the model sees, so report regeneration does not
+# re-run the model
+LLM_SUMMARY_CACHE_SIZE = 256
+_llm_summary_cache: "OrderedDict[str, str]" = OrderedDict()
+# Summaries are built from concurrent requests
+_llm_summary_cache_lock = threading.Lock()
+
 
 def build_contract_summary(contract: Contract, use_llm: bool = False) -> str:
     """
@@ -20,14 +36,48 @@ def build_contract_summary(contract: Contract, use_llm: bool = False) -> str:
         Summary text
     """
     if use_llm:
+        key = _llm_summary_cache_key(contract)
+        with _llm_summary_cache_lock:
+            cached = _llm_summary_cache.get(key)
+            if cached is not None:
+                _llm_summary_cache.move_to_end(key)
+        if cached is not None:
+            return cached
+
         try:
-            return _build_llm_summary(contract)
+            summary = _build_llm_summary(contract)
         except Exception as e:
             logger.warning(f"LLM summary failed, falling back to rule-based: {e}")
+        else:
+            with _llm_summary_cache_lock:
+                _llm_summary_cache[key] = summary
+                if len(_llm_summary_cache) > LLM_SUMMARY_CACHE_SIZE:
+                    _llm_summary_cache.popitem(last=False)
+            return summary
 
     return _build_rule_based_summary(contract)
 
 
+def _llm_summary_cache_key(contract: Contract) -> str:
+    """Key an LLM summary on the prompt version, provider, model and text prefix."""
+    from lexguard.llm.prompts import CONTRACT_SUMMARY_PROMPT_VERSION
+    from lexguard.llm.verdict_cache import active_model
+
+    digest = hashlib.blake2b(
+        contract.text[:LLM_SUMMARY_MAX_CHARS].encode("utf-8"), digest_size=16
+    ).hexdigest()
+    truncated = len(contract.text) > LLM_SUMMARY_MAX_CHARS
+    return "|".join(
+        (
+            CONTRACT_SUMMARY_PROMPT_VERSION,
+            settings.llm_provider,
+            active_model(),
+            str(truncated),
+            digest,
+        )
+    )
+
+
 def _build_llm_summary(contract: Contract) -> str:
     """
     Generate summary using LLM.
@@ -44,8 +94,8 @@ def _build_llm_summary(contract: Contract) -> str:
     llm = get_llm_client()
 
     # Truncate text if too long (keep first 8000 chars)
-    text = contract.text[:8000]
-    if len(contract.text) > 8000:
+    text = contract.text[:LLM_SUMMARY_MAX_CHARS]
+    if len(contract.text) > LLM_SUMMARY_MAX_CHARS:
         text += "\n\n[Document truncated for analysis...]"
 
     prompt = CONTRACT_SUMMARY_PROMPT.format(contract_text=text)
@@ -74,28 +124,28 @@ def _build_rule_based_summary(contract: Contract) -> str:
     """
     clauses = contract.clauses
 
+    if not clauses:
+        return (
+            f"📄 **Contract Summary: {contract.title}**\n\n"
+            "No clauses were extracted from this document."
+        )
+
     # Count clause types and risks
-    clause_type_counts = {}
-    risk_counts = {"high": 0, "medium": 0, "low": 0}
+    clause_types = [_get_clause_type_value(clause) for clause in clauses]
+    clause_type_counts = Counter(clause_types)
+    risk_counts = Counter(clause.risk_level for clause in clauses if clause.risk_level)
     high_risk_clauses = []
     key_clauses_by_type = {}
 
-    for clause in clauses:
-        # Count clause types
-        clause_type = _get_clause_type_value(clause)
-        clause_type_counts[clause_type] = clause_type_counts.get(clause_type, 0) + 1
-
-        # Count risk levels
-        if clause.risk_level:
-            risk_counts[clause.risk_level] += 1
-            if clause.risk_level == "high":
-                high_risk_clauses.append(clause)
+    # One pass, reusing each clause's normalized type
+    for clause, clause_type in zip(clauses, clause_types):
+        if clause.risk_level == "high":
+            high_risk_clauses.append((clause, clause_type))
 
         # Collect key clauses by type (first 2 of each type)
-        if clause_type not in key_clauses_by_type or len(key_clauses_by_type[clause_type]) < 2:
-            if clause_type not in key_clauses_by_type:
-                key_clauses_by_type[clause_type] = []
-            key_clauses_by_type[clause_type].append(clause)
+        key_clauses = key_clauses_by_type.setdefault(clause_type, [])
+        if len(key_clauses) < 2:
+            key_clauses.append(clause)
 
     # Build comprehensive summary
     summary_parts = [
@@ -147,8 +197,7 @@ def _build_rule_based_summary(contract: Contract) -> str:
         if payment_clauses:
             summary_parts.append(f"\n💰 **Payment Terms:**")
             for clause in payment_clauses[:2]:
-                snippet = clause.text[:200] + "..." if len(clause.text) > 200 else clause.text
-                summary_parts.append(f"  • {snippet}")
+                summary_parts.append(f"  • {_snippet(clause.text, 200)}")
 
     # Termination terms
     if "termination" in clause_type_counts:
@@ -156,8 +205,7 @@ def _build_rule_based_summary(contract: Contract) -> str:
         if term_clauses:
             summary_parts.append(f"\n🚪 **Termination Conditions:**")
             for clause in term_clauses[:2]:
-                snippet = clause.text[:200] + "..." if len(clause.text) > 200 else clause.text
-                summary_parts.append(f"  • {snippet}")
+                summary_parts.append(f"  • {_snippet(clause.text, 200)}")
 
     # Liability terms
     if "liability" in clause_type_counts:
@@ -165,16 +213,14 @@ def _build_rule_based_summary(contract: Contract) -> str:
         if liability_clauses:
             summary_parts.append(f"\n🛡️ **Liability Terms:**")
             for clause in liability_clauses[:2]:
-                snippet = clause.text[:200] + "..." if len(clause.text) > 200 else clause.text
-                summary_parts.append(f"  • {snippet}")
+                summary_parts.append(f"  • {_snippet(clause.text, 200)}")
 
     # High-risk clause warnings
     if high_risk_clauses:
         summary_parts.append(f"\n🚨 **High-Risk Clauses Requiring Attention:**")
-        for clause in high_risk_clauses[:3]:
-            clause_type = _get_clause_type_value(clause).replace("_", " ").title()
-            snippet = clause.text[:180] + "..." if len(clause.text) > 180 else clause.text
-            summary_parts.append(f"  • **{clause_type}**: {snippet}")
+        for clause, clause_type in high_risk_clauses[:3]:
+            clause_type = clause_type.replace("_", " ").title()
+            summary_parts.append(f"  • **{clause_type}**: {_snippet(clause.text, 180)}")
 
     # Recommendations
     summary_parts.append(f"\n💡 **Recommendations:**")
@@ -199,17 +245,20 @@ def get_key_risks(contract: Contract, limit: int = 5) -> list[str]:
     Returns:
         List of key risk descriptions
     """
-    high_risk_clauses = [
+    # Stop scanning once `limit` high-risk clauses have been found
+    high_risk_clauses = (
         clause for clause in contract.clauses if clause.risk_level == "high"
+    )
+
+    return [
+        f"{_get_clause_type_value(clause).replace('_', ' ').title()}: {clause.text[:100]}..."
+        for clause in islice(high_risk_clauses, limit)
     ]
 
-    risks = []
-    for clause in high_risk_clauses[:limit]:
-        clause_type_str = _get_clause_type_value(clause).replace("_", " ").title()
-        risk_text = f"{clause_type_str}: {clause.text[:100]}..."
-        risks.append(risk_text)
 
-    return risks
+def _snippet(text: str, limit: int) -> str:
+    """Return text cut to `limit` characters, with an ellipsis when shortened."""
+    return text if len(text) <= limit else text[:limit] + "..."
 
 
 def _get_clause_type_value(clause) -> str:
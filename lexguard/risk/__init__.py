@@ -1,9 +1,24 @@
 """Risk assessment and negotiation modules."""
 
-from lexguard.risk.negotiation import suggest_negotiation_points
-from lexguard.risk.scoring import calculate_clause_risk, score_to_level
+from lexguard.risk.negotiation import (
+    suggest_negotiation_points,
+    suggest_negotiation_points_bulk,
+)
+from lexguard.risk.scoring import (
+    calculate_clause_risk,
+    calculate_contract_risks,
+    calculate_contract_risks_async,
+    score_to_level,
+)
 
-__all__ = ["calculate_clause_risk", "score_to_level", "suggest_negotiation_points"]
+__all__ = [
+    "calculate_clause_risk",
+    "calculate_contract_risks",
+    "calculate_contract_risks_async",
+    "score_to_level",
+    "suggest_negotiation_points",
+    "suggest_negotiation_points_bulk",
+]
 
 
 
@@ -1,12 +1,68 @@
 """Negotiation suggestions for contract clauses."""
 
+import asyncio
 import logging
-from typing import List
+from typing import Dict, List, Tuple
 
 from lexguard.models.clause import Clause, ClauseType
 
 logger = logging.getLogger(__name__)
 
+# Maximum LLM suggestion requests in flight for bulk generation
+LLM_SUGGESTION_CONCURRENCY = 8
+
+# Rule-based negotiation suggestions per clause type
+_RULE_SUGGESTIONS: Dict[ClauseType, Tuple[str, ...]] = {
+    ClauseType.LIABILITY: (
+        "Request a cap on total liability (e.g., contract value or specific amount)",
+        "Exclude indirect, consequential, or punitive damages",
+        "Add mutual indemnification provisions",
+        "Clarify what events trigger indemnification",
+        "Request right to defend claims with own counsel",
+    ),
+    ClauseType.TERMINATION: (
+        "Negotiate longer notice period (30-90 days)",
+        "Request termination only 'for cause' with defined reasons",
+        "Add severance or termination payment provisions",
+        "Include dispute resolution before termination",
+        "Clarify obligations upon termination",
+    ),
+    ClauseType.NON_COMPETE: (
+        "Reduce duration to 6-12 months maximum",
+        "Narrow geographic scope to specific regions",
+        "Define 'competing business' more narrowly",
+        "Add exceptions for existing commitments",
+        "Include compensation for non-compete period",
+    ),
+    ClauseType.IP: (
+        "Exclude pre-existing intellectual property",
+        "Limit assignment to work created during employment",
+        "Add carve-out for personal projects",
+        "Clarify ownership of derivative works",
+        "Request license-back for your contributions",
+    ),
+    ClauseType.CONFIDENTIALITY: (
+        "Define 'confidential information' more clearly",
+        "Add exceptions for public information",
+        "Limit duration of confidentiality obligations",
+        "Exclude information already known",
+        "Allow disclosure when legally required",
+    ),
+    ClauseType.PAYMENT: (
+        "Specify exact payment amounts and schedule",
+        "Add late payment penalties or interest",
+        "Include expense reimbursement terms",
+        "Clarify payment method and currency",
+        "Add cost-of-living or performance adjustments",
+    ),
+}
+
+_DEFAULT_SUGGESTIONS: Tuple[str, ...] = (
+    "Request clearer definitions of key terms",
+    "Add specific performance metrics or criteria",
+    "Include dispute resolution procedures",
+)
+
 
 def suggest_negotiation_points(clause: Clause, use_llm: bool = False) -> List[str]:
     """
@@ -30,15 +86,54 @@ def suggest_negotiation_points(clause: Clause, use_llm: bool = False) -> List[st
         except Exception as e:
             logger.warning(f"LLM suggestion generation failed: {e}")
 
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_suggestions = []
+    return _dedupe_suggestions(suggestions)
+
+
+async def suggest_negotiation_points_bulk(
+    clauses: List[Clause], use_llm: bool = True
+) -> List[List[str]]:
+    """
+    Generate negotiation suggestions for many clauses, overlapping LLM calls.
+
+    LLM requests for medium/high-risk clauses are I/O-bound, so they run
+    concurrently in worker threads (at most LLM_SUGGESTION_CONCURRENCY at a
+    time). Rule-based suggestions are merged in afterwards.
+
+    Args:
+        clauses: Clauses to analyze
+        use_llm: Whether to use LLM for suggestions
+
+    Returns:
+        One list of suggestions per clause, in input order
+    """
+    semaphore = asyncio.Semaphore(LLM_SUGGESTION_CONCURRENCY)
+
+    async def llm_suggestions_for(clause: Clause) -> List[str]:
+        if not (use_llm and clause.risk_level in ("medium", "high")):
+            return []
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_get_llm_suggestions, clause)
+            except Exception as e:
+                logger.warning(f"LLM suggestion generation failed: {e}")
+                return []
+
+    llm_results = await asyncio.gather(*(llm_suggestions_for(clause) for clause in clauses))
+
+    return [
+        _dedupe_suggestions(_get_rule_based_suggestions(clause) + llm_suggestions)
+        for clause, llm_suggestions in zip(clauses, llm_results)
+    ]
+
+
+def _dedupe_suggestions(suggestions: List[str]) -> List[str]:
+    """Remove duplicates and keep the top 5 suggestions."""
+    # Case-insensitive, order-preserving; the first spelling of each wins
+    unique_suggestions: Dict[str, str] = {}
     for s in suggestions:
-        if s.lower() not in seen:
-            seen.add(s.lower())
-            unique_suggestions.append(s)
+        unique_suggestions.setdefault(s.lower(), s)
 
-    return unique_suggestions[:5]  # Limit to top 5
+    return list(unique_suggestions.values())[:5]  # Limit to top 5
 
 
 def _get_rule_based_suggestions(clause: Clause) -> List[str]:
@@ -51,84 +146,8 @@ def _get_rule_based_suggestions(clause: Clause) -> List[str]:
     Returns:
         List of suggestions
     """
-    suggestions = []
-
-    if clause.clause_type == ClauseType.LIABILITY:
-        suggestions.extend(
-            [
-                "Request a cap on total liability (e.g., contract value or specific amount)",
-                "Exclude indirect, consequential, or punitive damages",
-                "Add mutual indemnification provisions",
-                "Clarify what events trigger indemnification",
-                "Request right to defend claims with own counsel",
-            ]
-        )
-
-    elif clause.clause_type == ClauseType.TERMINATION:
-        suggestions.extend(
-            [
-                "Negotiate longer notice period (30-90 days)",
-                "Request termination only 'for cause' with defined reasons",
-                "Add severance or termination payment provisions",
-                "Include dispute resolution before termination",
-                "Clarify obligations upon termination",
-            ]
-        )
-
-    elif clause.clause_type == ClauseType.NON_COMPETE:
-        suggestions.extend(
-            [
-                "Reduce duration to 6-12 months maximum",
-                "Narrow geographic scope to specific regions",
-                "Define 'competing business' more narrowly",
-                "Add exceptions for existing commitments",
-                "Include compensation for non-compete period",
-            ]
-        )
-
-    elif clause.clause_type == ClauseType.IP:
-        suggestions.extend(
-            [
-                "Exclude pre-existing intellectual property",
-                "Limit assignment to work created during employment",
-                "Add carve-out for personal projects",
-                "Clarify ownership of derivative works",
-                "Request license-back for your contributions",
-            ]
-        )
-
-    elif clause.clause_type == ClauseType.CONFIDENTIALITY:
-        suggestions.extend(
-            [
-                "Define 'confidential information' more clearly",
-                "Add exceptions for public information",
-                "Limit duration of confidentiality obligations",
-                "Exclude information already known",
-                "Allow disclosure when legally required",
-            ]
-        )
-
-    elif clause.clause_type == ClauseType.PAYMENT:
-        suggestions.extend(
-            [
-                "Specify exact payment amounts and schedule",
-                "Add late payment penalties or interest",
-                "Include expense reimbursement terms",
-                "Clarify payment method and currency",
-                "Add cost-of-living or performance adjustments",
-            ]
-        )
-
-    else:
-        suggestions.extend(
-            [
-                "Request clearer definitions of key terms",
-                "Add specific performance metrics or criteria",
-                "Include dispute resolution procedures",
-            ]
-        )
-
-    return suggestions
+    # clause_type is stored as its string value; str-enum keys hash alike
+    return list(_RULE_SUGGESTIONS.get(clause.clause_type, _DEFAULT_SUGGESTIONS))
 
 
 def _get_llm_suggestions(clause: Clause) -> List[str]:
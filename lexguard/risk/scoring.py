@@ -1,14 +1,53 @@
 """Risk scoring logic for contract clauses."""
 
+import asyncio
 import re
 import logging
-from typing import Literal, Tuple, List
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from typing import Callable, Dict, FrozenSet, List, Literal, Optional, Tuple
 
 from lexguard.models.clause import Clause, ClauseType
 from lexguard.models.risk import ClauseRisk
 
 logger = logging.getLogger(__name__)
 
+# Maximum LLM risk-scoring requests in flight for a contract
+LLM_RISK_CONCURRENCY = 8
+
+# Number of (clause type, text) rule results kept in memory
+RISK_CACHE_SIZE = 4096
+_risk_cache: "OrderedDict[Tuple[str, str], Tuple[float, Tuple[str, ...]]]" = OrderedDict()
+# Contracts are scored concurrently from request handlers and worker threads
+_risk_cache_lock = threading.Lock()
+
+# Lower bounds of the "medium" and "high" levels; see score_to_level
+_LEVEL_THRESHOLDS = (0.33, 0.66)
+_LEVELS: Tuple[Literal["low", "medium", "high"], ...] = ("low", "medium", "high")
+
+# Joins clause texts for the pooled phrase scan; not a word or space character,
+# so no match can span two clauses
+_POOL_SEPARATOR = "\x00"
+
+# Multi-word rules (variable whitespace) as one alternation so each clause is
+# scanned in a single pass; the named group of each match identifies the rule.
+# Single-word rules use _has_word instead, which is cheaper than regex.
+_RE_KEYWORDS = re.compile(
+    r"\b(?:"
+    r"(?P<HOLD_HARMLESS>hold\s+harmless\b)"
+    r"|(?P<WITHOUT_CAUSE>without\s+cause\b)"
+    r"|(?P<ALL_WORK>all\s+(?:work|invention|creation))"
+    r"|(?P<NO_PAY>no\s+(?:pay|compensation|salary)\b)"
+    r"|(?P<AT_WILL>at\s+will\b)"
+    r")"
+)
+
+# Numeric rules need the captured value and unit, so they stay separate; one
+# pattern serves both notice periods and non-compete durations
+_RE_QUANTITY = re.compile(r"(\d+)\s*(year|month|day|hour)")
+
 
 def calculate_clause_risk(clause: Clause, use_llm: bool = False) -> ClauseRisk:
     """
@@ -23,17 +62,116 @@ def calculate_clause_risk(clause: Clause, use_llm: bool = False) -> ClauseRisk:
     """
     # Calculate base score using rules
     score, reasons = _calculate_risk_score(clause)
+    llm_result = None
 
     # Optionally enhance with LLM
     if use_llm:
         try:
-            llm_score, llm_reasons = _calculate_risk_with_llm(clause)
-            # Blend scores (70% LLM, 30% rules)
-            score = 0.7 * llm_score + 0.3 * score
-            reasons.extend(llm_reasons)
+            llm_result = _calculate_risk_with_llm(clause)
         except Exception as e:
             logger.warning(f"LLM risk scoring failed: {e}")
 
+    return _blend_risk(clause, score, reasons, llm_result)
+
+
+def calculate_contract_risks(clauses: List[Clause], use_llm: bool = False) -> List[ClauseRisk]:
+    """
+    Calculate risk assessments for all clauses of a contract.
+
+    Without the LLM, the multi-word phrase rules run as one regex pass over
+    the pooled text of every distinct clause not already in the score cache,
+    instead of one pass per clause.
+
+    Args:
+        clauses: Clauses to assess
+        use_llm: Whether to use LLM for enhanced scoring
+
+    Returns:
+        One ClauseRisk per clause, in input order
+    """
+    if use_llm:
+        return [calculate_clause_risk(clause, use_llm=True) for clause in clauses]
+
+    keys = [_risk_cache_key(clause) for clause in clauses]
+    results = [_get_cached_risk(key) for key in keys]
+
+    missing = [i for i, result in enumerate(results) if result is None]
+    if missing:
+        # Score each distinct (type, text) once; contracts often repeat boilerplate
+        missing_keys = list(dict.fromkeys(keys[i] for i in missing))
+        pooled_hits = _pooled_phrase_hits([text_lower for _, text_lower in missing_keys])
+        scored = {
+            key: _cache_risk(key, _apply_rules(*key, hits))
+            for key, hits in zip(missing_keys, pooled_hits)
+        }
+        for i in missing:
+            results[i] = scored[keys[i]]
+
+    return [
+        _finalize_risk(clause, score, list(reasons), trusted=True)
+        for clause, (score, reasons) in zip(clauses, results)
+    ]
+
+
+async def calculate_contract_risks_async(
+    clauses: List[Clause], use_llm: bool = True
+) -> List[ClauseRisk]:
+    """
+    Calculate risk assessments for all clauses, overlapping LLM calls.
+
+    LLM scoring is I/O-bound, so the requests run concurrently in worker
+    threads (at most LLM_RISK_CONCURRENCY at a time). Rule-based scores are
+    computed on the calling thread and blended in afterwards.
+
+    Args:
+        clauses: Clauses to assess
+        use_llm: Whether to use LLM for enhanced scoring
+
+    Returns:
+        One ClauseRisk per clause, in input order
+    """
+    if not use_llm:
+        return calculate_contract_risks(clauses)
+
+    semaphore = asyncio.Semaphore(LLM_RISK_CONCURRENCY)
+
+    async def llm_risk_for(clause: Clause) -> Optional[Tuple[float, List[str]]]:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(_calculate_risk_with_llm, clause)
+            except Exception as e:
+                logger.warning(f"LLM risk scoring failed: {e}")
+                return None
+
+    llm_results = await asyncio.gather(*(llm_risk_for(clause) for clause in clauses))
+
+    return [
+        _blend_risk(clause, *_calculate_risk_score(clause), llm_result)
+        for clause, llm_result in zip(clauses, llm_results)
+    ]
+
+
+def _blend_risk(
+    clause: Clause,
+    score: float,
+    reasons: List[str],
+    llm_result: Optional[Tuple[float, List[str]]],
+) -> ClauseRisk:
+    """Blend the rule-based result with an optional LLM result."""
+    if llm_result is None:
+        return _finalize_risk(clause, score, reasons, trusted=True)
+
+    llm_score, llm_reasons = llm_result
+    # Blend scores (70% LLM, 30% rules)
+    score = 0.7 * llm_score + 0.3 * score
+    reasons.extend(llm_reasons)
+    return _finalize_risk(clause, score, reasons, trusted=False)
+
+
+def _finalize_risk(
+    clause: Clause, score: float, reasons: List[str], trusted: bool
+) -> ClauseRisk:
+    """Record the score on the clause and build its ClauseRisk."""
     # Convert score to level
     level = score_to_level(score)
 
@@ -41,7 +179,10 @@ def calculate_clause_risk(clause: Clause, use_llm: bool = False) -> ClauseRisk:
     clause.risk_score = score
     clause.risk_level = level
 
-    return ClauseRisk(
+    # Rule-based output is already in range, so skip pydantic validation
+    # on this hot path; LLM-influenced results are still validated.
+    factory = ClauseRisk.model_construct if trusted else ClauseRisk
+    return factory(
         clause_id=clause.id,
         score=score,
         level=level,
@@ -54,129 +195,255 @@ def _calculate_risk_score(clause: Clause) -> Tuple[float, List[str]]:
     """
     Calculate risk score using rule-based heuristics.
 
+    The rules are a pure function of the clause type and text, so results
+    are cached; boilerplate clauses recurring across contracts score once.
+
+    Returns:
+        (score, reasons) tuple
+    """
+    key = _risk_cache_key(clause)
+    result = _get_cached_risk(key)
+    if result is None:
+        result = _cache_risk(key, _score_text(*key))
+
+    score, reasons = result
+    return score, list(reasons)
+
+
+def _risk_cache_key(clause: Clause) -> Tuple[str, str]:
+    """Return the (clause type value, lowercased text) cache key for a clause."""
+    # clause_type might be string or enum depending on Pydantic serialization
+    return ClauseType(clause.clause_type).value, clause.text_lower
+
+
+def _get_cached_risk(key: Tuple[str, str]) -> Optional[Tuple[float, Tuple[str, ...]]]:
+    """Look up a cached rule result, marking it recently used."""
+    with _risk_cache_lock:
+        result = _risk_cache.get(key)
+        if result is not None:
+            _risk_cache.move_to_end(key)
+    return result
+
+
+def _cache_risk(
+    key: Tuple[str, str], result: Tuple[float, Tuple[str, ...]]
+) -> Tuple[float, Tuple[str, ...]]:
+    """Store a rule result, evicting the least recently used beyond RISK_CACHE_SIZE."""
+    with _risk_cache_lock:
+        _risk_cache[key] = result
+        if len(_risk_cache) > RISK_CACHE_SIZE:
+            _risk_cache.popitem(last=False)
+    return result
+
+
+def _score_text(clause_type: str, text_lower: str) -> Tuple[float, Tuple[str, ...]]:
+    """Apply the rule-based heuristics to one lowercased clause text."""
+    hits = frozenset(match.lastgroup for match in _RE_KEYWORDS.finditer(text_lower))
+    return _apply_rules(clause_type, text_lower, hits)
+
+
+def _pooled_phrase_hits(texts: List[str]) -> List[FrozenSet[str]]:
+    """
+    Find the multi-word phrase rules matched by each text in one regex pass.
+
+    Args:
+        texts: Lowercased clause texts
+
+    Returns:
+        Set of matched rule names per text, in input order
+    """
+    joined = _POOL_SEPARATOR.join(texts)
+    # Offset of each text within the joined string
+    starts = [0, *accumulate(len(text) + len(_POOL_SEPARATOR) for text in texts[:-1])]
+
+    hits: List[set] = [set() for _ in texts]
+    for match in _RE_KEYWORDS.finditer(joined):
+        hits[bisect_right(starts, match.start()) - 1].add(match.lastgroup)
+
+    return [frozenset(text_hits) for text_hits in hits]
+
+
+def _notice_period_risk(text_lower: str) -> Optional[Tuple[float, str]]:
+    """Flag short termination notice periods."""
+    notice = _first_quantity(text_lower, ("day", "hour"))
+    if notice:
+        value, unit = notice
+        days = value / 24 if unit == "hour" else value
+        if days < 7:
+            return 0.25, f"Very short notice period ({value} {unit}s)"
+        if days < 30:
+            return 0.1, f"Short notice period ({value} {unit}s)"
+    return None
+
+
+def _non_compete_duration_risk(text_lower: str) -> Optional[Tuple[float, str]]:
+    """Flag long non-compete durations."""
+    duration = _first_quantity(text_lower, ("year", "month"))
+    if duration:
+        value, unit = duration
+        months = value * 12 if unit == "year" else value
+        if months > 24:
+            return 0.3, f"Very long non-compete duration ({months} months)"
+        if months > 12:
+            return 0.15, f"Long non-compete duration ({months} months)"
+    return None
+
+
+# Rule tables. Keyword rules are (predicate(text_lower, hits), delta, reason);
+# quantity rules return an optional (delta, reason) and run before the keyword
+# rules of their clause type. Reasons keep the order rules are listed in.
+_KeywordRule = Tuple[Callable[[str, FrozenSet[str]], bool], float, str]
+
+_TYPE_BASE_RISK: Dict[str, float] = {
+    ClauseType.LIABILITY: 0.6,
+    ClauseType.NON_COMPETE: 0.5,
+    ClauseType.TERMINATION: 0.4,
+    ClauseType.IP: 0.4,
+    ClauseType.CONFIDENTIALITY: 0.3,
+    ClauseType.PAYMENT: 0.2,
+    ClauseType.MISC: 0.1,
+    ClauseType.UNSURE: 0.2,
+}
+
+_QUANTITY_RULES: Dict[str, Callable[[str], Optional[Tuple[float, str]]]] = {
+    ClauseType.TERMINATION: _notice_period_risk,
+    ClauseType.NON_COMPETE: _non_compete_duration_risk,
+}
+
+_TYPE_RULES: Dict[str, Tuple[_KeywordRule, ...]] = {
+    ClauseType.LIABILITY: (
+        (lambda t, hits: _has_word(t, "unlimited"), 0.2, "Contains 'unlimited' liability"),
+        (
+            lambda t, hits: _has_any_word(t, ("indemnify", "indemnification")),
+            0.15,
+            "Includes indemnification obligations",
+        ),
+        (lambda t, hits: "HOLD_HARMLESS" in hits, 0.1, "Contains hold harmless clause"),
+        (
+            lambda t, hits: not _has_any_word(t, ("limited", "limitation")),
+            0.1,
+            "No liability limitation mentioned",
+        ),
+    ),
+    ClauseType.TERMINATION: (
+        (
+            lambda t, hits: _has_any_word(t, ("immediate", "immediately")),
+            0.2,
+            "Allows immediate termination",
+        ),
+        (lambda t, hits: "WITHOUT_CAUSE" in hits, 0.15, "Allows termination without cause"),
+    ),
+    ClauseType.NON_COMPETE: (
+        (
+            lambda t, hits: _has_any_word(t, ("global", "globally", "worldwide")),
+            0.2,
+            "Global or worldwide scope",
+        ),
+    ),
+    ClauseType.IP: (
+        (lambda t, hits: "ALL_WORK" in hits, 0.15, "Broad IP assignment clause"),
+        (lambda t, hits: not _has_word(t, "pre-existing"), 0.1, "No mention of pre-existing IP"),
+    ),
+    ClauseType.PAYMENT: (
+        (lambda t, hits: "NO_PAY" in hits, 0.4, "Unpaid or volunteer position"),
+        (lambda t, hits: "AT_WILL" in hits, 0.1, "At-will payment terms"),
+    ),
+}
+
+# Red flags checked for every clause type
+_GENERAL_RULES: Tuple[_KeywordRule, ...] = (
+    (lambda t, hits: _has_word(t, "irrevocable"), 0.1, "Contains irrevocable terms"),
+    (lambda t, hits: _has_word(t, "perpetual"), 0.15, "Perpetual/indefinite terms"),
+    (lambda t, hits: _has_word(t, "waive"), 0.1, "Contains rights waiver"),
+)
+
+
+def _apply_rules(
+    clause_type: str, text_lower: str, hits: FrozenSet[str]
+) -> Tuple[float, Tuple[str, ...]]:
+    """
+    Apply the rule-based heuristics to lowercased clause text.
+
+    Args:
+        clause_type: Clause type value
+        text_lower: Lowercased clause text
+        hits: Names of the multi-word phrase rules matched in the text
+
     Returns:
         (score, reasons) tuple
     """
-    score = 0.0
     reasons = []
-    text_lower = clause.text.lower()
-
-    # Base risk by clause type
-    type_risk = {
-        ClauseType.LIABILITY: 0.6,
-        ClauseType.NON_COMPETE: 0.5,
-        ClauseType.TERMINATION: 0.4,
-        ClauseType.IP: 0.4,
-        ClauseType.CONFIDENTIALITY: 0.3,
-        ClauseType.PAYMENT: 0.2,
-        ClauseType.MISC: 0.1,
-        ClauseType.UNSURE: 0.2,
-    }
-    score = type_risk.get(clause.clause_type, 0.2)
-
-    # Liability-specific risks
-    if clause.clause_type == ClauseType.LIABILITY:
-        if re.search(r"\bunlimited\b", text_lower):
-            score += 0.2
-            reasons.append("Contains 'unlimited' liability")
-
-        if re.search(r"\bindemnif(?:y|ication)\b", text_lower):
-            score += 0.15
-            reasons.append("Includes indemnification obligations")
-
-        if re.search(r"\bhold\s+harmless\b", text_lower):
-            score += 0.1
-            reasons.append("Contains hold harmless clause")
-
-        if not re.search(r"\blimit(?:ed|ation)\b", text_lower):
-            score += 0.1
-            reasons.append("No liability limitation mentioned")
-
-    # Termination-specific risks
-    elif clause.clause_type == ClauseType.TERMINATION:
-        # Check for short notice periods
-        notice_match = re.search(r"(\d+)\s*(?:day|hour)", text_lower)
-        if notice_match:
-            days = int(notice_match.group(1))
-            if days < 7:
-                score += 0.25
-                reasons.append(f"Very short notice period ({days} days)")
-            elif days < 30:
-                score += 0.1
-                reasons.append(f"Short notice period ({days} days)")
-
-        if re.search(r"\bimmediate(?:ly)?\b", text_lower):
-            score += 0.2
-            reasons.append("Allows immediate termination")
-
-        if re.search(r"\bwithout\s+cause\b", text_lower):
-            score += 0.15
-            reasons.append("Allows termination without cause")
-
-    # Non-compete specific risks
-    elif clause.clause_type == ClauseType.NON_COMPETE:
-        # Check duration
-        duration_match = re.search(r"(\d+)\s*(?:year|month)", text_lower)
-        if duration_match:
-            value = int(duration_match.group(1))
-            if "year" in text_lower:
-                months = value * 12
-            else:
-                months = value
-
-            if months > 24:
-                score += 0.3
-                reasons.append(f"Very long non-compete duration ({months} months)")
-            elif months > 12:
-                score += 0.15
-                reasons.append(f"Long non-compete duration ({months} months)")
-
-        if re.search(r"\bglobal(?:ly)?\b|\bworldwide\b", text_lower):
-            score += 0.2
-            reasons.append("Global or worldwide scope")
-
-    # IP-specific risks
-    elif clause.clause_type == ClauseType.IP:
-        if re.search(r"\ball\s+(?:work|invention|creation)", text_lower):
-            score += 0.15
-            reasons.append("Broad IP assignment clause")
-
-        if not re.search(r"\bpre-existing\b", text_lower):
-            score += 0.1
-            reasons.append("No mention of pre-existing IP")
-
-    # Payment-specific checks
-    elif clause.clause_type == ClauseType.PAYMENT:
-        if re.search(r"\bno\s+(?:pay|compensation|salary)\b", text_lower):
-            score += 0.4
-            reasons.append("Unpaid or volunteer position")
-
-        if re.search(r"\bat\s+will\b", text_lower):
-            score += 0.1
-            reasons.append("At-will payment terms")
-
-    # General red flags
-    if re.search(r"\birrevocable\b", text_lower):
-        score += 0.1
-        reasons.append("Contains irrevocable terms")
-
-    if re.search(r"\bperpetual\b", text_lower):
-        score += 0.15
-        reasons.append("Perpetual/indefinite terms")
-
-    if re.search(r"\bwaive\b", text_lower):
-        score += 0.1
-        reasons.append("Contains rights waiver")
+    score = _TYPE_BASE_RISK.get(clause_type, 0.2)
+
+    quantity_rule = _QUANTITY_RULES.get(clause_type)
+    if quantity_rule is not None:
+        flagged = quantity_rule(text_lower)
+        if flagged:
+            delta, reason = flagged
+            score += delta
+            reasons.append(reason)
+
+    for rules in (_TYPE_RULES.get(clause_type, ()), _GENERAL_RULES):
+        for predicate, delta, reason in rules:
+            if predicate(text_lower, hits):
+                score += delta
+                reasons.append(reason)
 
     # Cap score at 1.0
-    score = min(score, 1.0)
+    if score > 1.0:
+        score = 1.0
 
     if not reasons:
-        # clause_type might be string or enum depending on Pydantic serialization
-        clause_type_str = clause.clause_type if isinstance(clause.clause_type, str) else clause.clause_type.value
-        reasons.append(f"Standard {clause_type_str} clause")
+        reasons.append(f"Standard {clause_type} clause")
 
-    return score, reasons
+    return score, tuple(reasons)
+
+
+def _first_quantity(text_lower: str, units: Tuple[str, ...]) -> Optional[Tuple[int, str]]:
+    """
+    Find the first number followed by one of `units`.
+
+    Args:
+        text_lower: Lowercased clause text
+        units: Accepted units ("year", "month", "day", "hour")
+
+    Returns:
+        (value, unit) tuple, or None if there is no such quantity
+    """
+    for match in _RE_QUANTITY.finditer(text_lower):
+        if match.group(2) in units:
+            return int(match.group(1)), match.group(2)
+    return None
+
+
+def _has_word(text: str, word: str) -> bool:
+    """
+    Check whether `word` occurs in `text` as a whole word.
+
+    Equivalent to ``re.search(rf"\\b{word}\\b", text)`` for a word that starts
+    and ends with a word character, using str.find instead of the regex engine.
+    """
+    end_limit = len(text)
+    word_len = len(word)
+    start = text.find(word)
+    while start >= 0:
+        end = start + word_len
+        if (start == 0 or not _is_word_char(text[start - 1])) and (
+            end == end_limit or not _is_word_char(text[end])
+        ):
+            return True
+        start = text.find(word, start + 1)
+    return False
+
+
+def _has_any_word(text: str, words: Tuple[str, ...]) -> bool:
+    """Check whether any of `words` occurs in `text` as a whole word."""
+    return any(_has_word(text, word) for word in words)
+
+
+def _is_word_char(char: str) -> bool:
+    """Match the regex ``\\w`` class for a single character."""
+    return char.isalnum() or char == "_"
 
 
 def _calculate_risk_with_llm(clause: Clause) -> Tuple[float, List[str]]:
@@ -187,11 +454,19 @@ def _calculate_risk_with_llm(clause: Clause) -> Tuple[float, List[str]]:
         (score, reasons) tuple
     """
     from lexguard.llm import get_llm_client
-    from lexguard.llm.prompts import RISK_SCORING_PROMPT
+    from lexguard.llm.prompts import RISK_SCORING_PROMPT, RISK_SCORING_PROMPT_VERSION
+    from lexguard.llm.verdict_cache import get_verdict, put_verdict, verdict_key
+
+    clause_type_str = ClauseType(clause.clause_type).value
+
+    # Identical clauses (boilerplate) reuse an earlier verdict
+    key = verdict_key("risk", RISK_SCORING_PROMPT_VERSION, clause_type_str, clause.text)
+    cached = get_verdict(key)
+    if cached is not None:
+        return cached["score"], list(cached["reasons"])
 
     llm = get_llm_client()
 
-    clause_type_str = clause.clause_type if isinstance(clause.clause_type, str) else clause.clause_type.value
     prompt = RISK_SCORING_PROMPT.format(
         clause_type=clause_type_str, clause_text=clause.text
     )
@@ -206,6 +481,7 @@ def _calculate_risk_with_llm(clause: Clause) -> Tuple[float, List[str]]:
     score = float(result.get("score", 0.5))
     reasons = result.get("reasons", [])
 
+    put_verdict(key, {"score": score, "reasons": reasons})
     return score, reasons
 
 
@@ -219,10 +495,4 @@ def score_to_level(score: float) -> Literal["low", "medium", "high"]:
     Returns:
         Risk level category
     """
-    if score < 0.33:
-        return "low"
-    elif score < 0.66:
-        return "medium"
-    else:
-        return "high"
-
+    return _LEVELS[bisect_right(_LEVEL_THRESHOLDS, score)]
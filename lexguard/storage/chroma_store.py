@@ -1,7 +1,8 @@
 """ChromaDB client management."""
 
+import functools
 import logging
-from typing import Optional
+import threading
 
 import chromadb
 from chromadb import Client
@@ -10,8 +11,8 @@ from lexguard.config import settings
 
 logger = logging.getLogger(__name__)
 
-# Global ChromaDB client
-_chroma_client: Optional[Client] = None
+# lru_cache alone can run the factory twice when threads miss concurrently
+_client_lock = threading.Lock()
 
 
 def get_chroma_client() -> Client:
@@ -21,26 +22,26 @@ def get_chroma_client() -> Client:
     Returns:
         ChromaDB client instance
     """
-    global _chroma_client
+    with _client_lock:
+        return _make_client()
 
-    if _chroma_client is None:
-        logger.info(f"Initializing ChromaDB at {settings.chroma_db_path}")
 
-        # Ensure directory exists
-        settings.chroma_db_path.mkdir(parents=True, exist_ok=True)
+@functools.lru_cache(maxsize=1)
+def _make_client() -> Client:
+    """Create the persistent ChromaDB client (cached after the first call)."""
+    logger.info(f"Initializing ChromaDB at {settings.chroma_db_path}")
 
-        # Create persistent client
-        _chroma_client = chromadb.PersistentClient(path=str(settings.chroma_db_path))
+    # Ensure directory exists
+    settings.chroma_db_path.mkdir(parents=True, exist_ok=True)
 
-        logger.info("ChromaDB client initialized")
+    # Create persistent client
+    client = chromadb.PersistentClient(path=str(settings.chroma_db_path))
 
-    return _chroma_client
+    logger.info("ChromaDB client initialized")
+    return client
 
 
 def reset_chroma_client() -> None:
-    """Reset the global ChromaDB client (useful for testing)."""
-    global _chroma_client
-    _chroma_client = None
-
-
-
+    """Reset the cached ChromaDB client (useful for testing)."""
+    with _client_lock:
+        _make_client.cache_clear()
@@ -1,16 +1,27 @@
 """File-based storage for contracts."""
 
-import json
 import logging
+import os
+import tempfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Optional
 
+import orjson
+
 from lexguard.config import settings
 from lexguard.models.contract import Contract
 from lexguard.storage.schema import ContractMetadata
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to read contract files for listings
+LIST_MAX_WORKERS = 16
+
+# Suffix of the per-contract listing metadata sidecar
+METADATA_SUFFIX = ".meta.json"
+
 
 def save_contract(contract: Contract) -> None:
     """
@@ -25,11 +36,13 @@ def save_contract(contract: Contract) -> None:
     file_path = contracts_dir / f"{contract.id}.json"
 
     try:
-        # Convert to dict for JSON serialization
-        contract_dict = contract.model_dump(mode="json")
+        # orjson serializes datetimes natively, so skip pydantic's JSON-mode pass
+        contract_dict = contract.model_dump(mode="python")
+        _write_atomic(file_path, orjson.dumps(contract_dict))
 
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(contract_dict, f, indent=2, ensure_ascii=False)
+        # Listing metadata sidecar, so list_contracts never parses the clauses
+        metadata = _build_metadata(contract)
+        _write_atomic(_metadata_path(file_path), orjson.dumps(metadata.model_dump(mode="python")))
 
         logger.info(f"Saved contract {contract.id} to {file_path}")
 
@@ -56,10 +69,9 @@ def load_contract(contract_id: str) -> Optional[Contract]:
         return None
 
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            contract_dict = json.load(f)
-
-        contract = Contract(**contract_dict)
+        # pydantic-core parses and validates the bytes in one pass, without
+        # building an intermediate dict in Python
+        contract = Contract.model_validate_json(file_path.read_bytes())
         logger.info(f"Loaded contract {contract_id}")
         return contract
 
@@ -80,38 +92,13 @@ def list_contracts() -> List[ContractMetadata]:
     if not contracts_dir.exists():
         return []
 
-    metadata_list = []
+    paths = [p for p in contracts_dir.glob("*.json") if not p.name.endswith(METADATA_SUFFIX)]
+    if not paths:
+        return []
 
-    for file_path in contracts_dir.glob("*.json"):
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                contract_dict = json.load(f)
-
-            # Count risk levels
-            clauses = contract_dict.get("clauses", [])
-            risk_counts = {"high": 0, "medium": 0, "low": 0}
-
-            for clause in clauses:
-                risk_level = clause.get("risk_level")
-                if risk_level in risk_counts:
-                    risk_counts[risk_level] += 1
-
-            metadata = ContractMetadata(
-                id=contract_dict["id"],
-                title=contract_dict["title"],
-                uploaded_at=contract_dict["uploaded_at"],
-                original_filename=contract_dict["original_filename"],
-                clause_count=len(clauses),
-                high_risk_count=risk_counts["high"],
-                medium_risk_count=risk_counts["medium"],
-                low_risk_count=risk_counts["low"],
-            )
-
-            metadata_list.append(metadata)
-
-        except Exception as e:
-            logger.warning(f"Error reading contract metadata from {file_path}: {e}")
-            continue
+    # Reads and orjson parsing release the GIL, so threads overlap the I/O
+    with ThreadPoolExecutor(max_workers=min(LIST_MAX_WORKERS, len(paths))) as executor:
+        metadata_list = [m for m in executor.map(_read_metadata, paths) if m is not None]
 
     # Sort by upload date (newest first)
     metadata_list.sort(key=lambda x: x.uploaded_at, reverse=True)
@@ -119,6 +106,91 @@ def list_contracts() -> List[ContractMetadata]:
     return metadata_list
 
 
+def _read_metadata(file_path: Path) -> Optional[ContractMetadata]:
+    """
+    Read listing metadata for a stored contract file.
+
+    Uses the metadata sidecar when present and falls back to parsing the
+    full contract for files saved before sidecars existed.
+
+    Args:
+        file_path: Path to the contract JSON file
+
+    Returns:
+        Contract metadata, or None if the file could not be read
+    """
+    try:
+        try:
+            # One read, validated from bytes; no separate exists() stat
+            return ContractMetadata.model_validate_json(_metadata_path(file_path).read_bytes())
+        except FileNotFoundError:
+            pass  # Saved before sidecars existed; fall back to the full contract
+
+        contract_dict = orjson.loads(file_path.read_bytes())
+
+        # Count risk levels
+        clauses = contract_dict.get("clauses", [])
+        risk_counts = Counter(clause.get("risk_level") for clause in clauses)
+
+        return ContractMetadata(
+            id=contract_dict["id"],
+            title=contract_dict["title"],
+            uploaded_at=contract_dict["uploaded_at"],
+            original_filename=contract_dict["original_filename"],
+            clause_count=len(clauses),
+            high_risk_count=risk_counts["high"],
+            medium_risk_count=risk_counts["medium"],
+            low_risk_count=risk_counts["low"],
+        )
+
+    except Exception as e:
+        logger.warning(f"Error reading contract metadata from {file_path}: {e}")
+        return None
+
+
+def _build_metadata(contract: Contract) -> ContractMetadata:
+    """Build listing metadata for a contract."""
+    risk_counts = Counter(clause.risk_level for clause in contract.clauses)
+
+    return ContractMetadata(
+        id=contract.id,
+        title=contract.title,
+        uploaded_at=contract.uploaded_at,
+        original_filename=contract.original_filename,
+        clause_count=len(contract.clauses),
+        high_risk_count=risk_counts["high"],
+        medium_risk_count=risk_counts["medium"],
+        low_risk_count=risk_counts["low"],
+    )
+
+
+def _write_atomic(file_path: Path, data: bytes) -> None:
+    """
+    Write bytes to a file so readers never see a partial write.
+
+    The data goes to a temporary file in the same directory, which then
+    replaces the target with os.replace (atomic on POSIX and Windows).
+
+    Args:
+        file_path: Destination path
+        data: File contents
+    """
+    # Unique temp name so concurrent saves of one contract cannot collide
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f"{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _metadata_path(file_path: Path) -> Path:
+    """Return the metadata sidecar path for a contract file."""
+    return file_path.with_suffix(METADATA_SUFFIX)
+
+
 def delete_contract(contract_id: str) -> bool:
     """
     Delete a contract from storage.
@@ -137,6 +209,7 @@ def delete_contract(contract_id: str) -> bool:
 
     try:
         file_path.unlink()
+        _metadata_path(file_path).unlink(missing_ok=True)
         logger.info(f"Deleted contract {contract_id}")
         return True
 
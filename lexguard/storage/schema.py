@@ -1,11 +1,8 @@
 """Data schema definitions for storage."""
 
 from pydantic import BaseModel
-from typing import List, Optional
 from datetime import datetime
 
-from lexguard.models.clause import Clause
-
 
 class ContractMetadata(BaseModel):
     """Lightweight contract metadata for listings."""
@@ -23,22 +20,3 @@ class ContractMetadata(BaseModel):
         """Pydantic config."""
 
         json_encoders = {datetime: lambda v: v.isoformat()}
-
-
-class ContractStorage(BaseModel):
-    """Storage format for persisted contracts."""
-
-    id: str
-    title: str
-    uploaded_at: datetime
-    original_filename: str
-    text: str
-    clauses: List[Clause]
-
-    class Config:
-        """Pydantic config."""
-
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
-
-
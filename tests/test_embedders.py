@@ -0,0 +1,115 @@
+"""Tests for the lightweight embedding fallback."""
+
+import numpy as np
+import pytest
+
+from lexguard.nlp import embedders
+from lexguard.nlp.embedders import (
+    SIMPLE_EMBEDDING_DIM,
+    _get_chromadb_embeddings_batch,
+    _get_simple_embedding,
+)
+
+
+def test_simple_embedding_dimensions():
+    """Test that the simple embedding has a fixed size."""
+    embedding = _get_simple_embedding("The contractor shall be paid $5,000 per month.")
+
+    assert len(embedding) == SIMPLE_EMBEDDING_DIM
+    assert all(isinstance(value, float) for value in embedding)
+
+
+def test_simple_embedding_features():
+    """Test character and word frequency features."""
+    embedding = _get_simple_embedding("the a")
+
+    # 'a' appears once in a 5-character text (1/5); 'the' is the first
+    # common word, one of two words (1/2). Ratios survive normalization.
+    assert embedding[0] / embedding[50] == pytest.approx((1 / 5) / (1 / 2))
+
+
+def test_simple_embedding_splits_words_on_non_ascii_punctuation():
+    """Test that words separated by non-ASCII punctuation are still counted."""
+    embedding = _get_simple_embedding("«the»\u00a0§and·or、but」")
+    words = embedding[embedders._WORD_SLICE]
+
+    # the, and, or, but: four common words, each one of four words
+    assert np.count_nonzero(words) == 4
+    assert words[0] == words[1] == words[2] == words[3] > 0
+
+
+def test_simple_embedding_is_normalized():
+    """Test that simple embeddings are unit vectors."""
+    for text in ["Payment is due monthly.", ""]:
+        assert np.linalg.norm(_get_simple_embedding(text)) == pytest.approx(1.0)
+
+
+def test_simple_embedding_empty_text():
+    """Test that empty text still produces a valid vector."""
+    embedding = _get_simple_embedding("")
+
+    assert len(embedding) == SIMPLE_EMBEDDING_DIM
+
+
+def test_simple_embedding_batch_matches_single():
+    """Test that the batch path matches single-text embeddings."""
+    texts = ["Termination with notice.", "Payment is due monthly.", ""]
+
+    batch = _get_chromadb_embeddings_batch(texts)
+
+    assert batch.shape == (len(texts), SIMPLE_EMBEDDING_DIM)
+    assert batch.dtype == np.float32
+    assert np.allclose(batch, [_get_simple_embedding(text) for text in texts])
+
+
+def test_simple_embedding_batch_process_pool(monkeypatch):
+    """Test that the process-pool path matches the serial path."""
+    texts = [f"Clause {i}: payment is due within {i} days." for i in range(8)]
+    serial = _get_chromadb_embeddings_batch(texts)
+
+    monkeypatch.setattr(embedders, "SIMPLE_EMBEDDING_PROCESS_MIN", 4)
+    monkeypatch.setattr(embedders.os, "cpu_count", lambda: 2)
+    try:
+        parallel = _get_chromadb_embeddings_batch(texts)
+        pool = embedders._get_simple_embedding_pool()
+        again = _get_chromadb_embeddings_batch(texts)
+        # The pool is started once and reused
+        assert embedders._get_simple_embedding_pool() is pool
+    finally:
+        embedders._shutdown_simple_embedding_pool()
+
+    assert parallel.dtype == np.float32
+    assert np.array_equal(parallel, serial)
+    assert np.array_equal(again, serial)
+
+
+def test_fallback_embeddings_are_not_cached(monkeypatch):
+    """Test that vectors from a fallback model never land under the provider's key."""
+    monkeypatch.setattr(embedders.settings, "embedding_provider", "ollama")
+    monkeypatch.setattr(embedders.settings, "embedding_model", "nomic-embed-text")
+    monkeypatch.setattr(embedders, "HAS_SENTENCE_TRANSFORMERS", True)
+    monkeypatch.setattr(embedders, "_embedding_cache", embedders.OrderedDict())
+
+    def ollama_down(coro):
+        coro.close()
+        raise ConnectionError("Ollama is down")
+
+    monkeypatch.setattr(embedders, "_run_coroutine", ollama_down)
+    monkeypatch.setattr(
+        embedders,
+        "_get_sentence_transformer_embeddings_batch",
+        lambda texts: np.ones((len(texts), 384), dtype=np.float32),
+    )
+
+    fallback = embedders.get_embeddings_batch_np(["Payment is due monthly."])
+    assert fallback.shape == (1, 384)
+    assert len(embedders._embedding_cache) == 0
+
+    # Once Ollama is back, its own vectors are cached as usual
+    def ollama_up(coro):
+        coro.close()
+        return [[0.5] * 768]
+
+    monkeypatch.setattr(embedders, "_run_coroutine", ollama_up)
+    assert embedders.get_embeddings_batch_np(["Payment is due monthly."]).shape == (1, 768)
+    assert len(embedders._embedding_cache) == 1
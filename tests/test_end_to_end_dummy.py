@@ -6,7 +6,7 @@ from datetime import datetime
 
 from lexguard.models import Contract, Clause, ClauseType
 from lexguard.nlp.chunker import split_into_clauses
-from lexguard.nlp.clause_classifier import classify_clause
+from lexguard.nlp.clause_classifier import classify_clause, classify_clauses
 from lexguard.risk.scoring import calculate_clause_risk
 from lexguard.storage.file_store import save_contract, load_contract, delete_contract
 
@@ -128,6 +128,16 @@ def test_clause_classification_accuracy(sample_contract_text):
         assert classifications["termination"] == ClauseType.TERMINATION
 
 
+def test_batch_classification_matches_single(sample_contract_text):
+    """Test that batch classification preserves order and results."""
+    clause_texts = split_into_clauses(sample_contract_text, min_length=30)
+
+    batch_types = classify_clauses(clause_texts)
+    single_types = [classify_clause(text) for text in clause_texts]
+
+    assert batch_types == single_types
+
+
 def test_risk_distribution(sample_contract_text):
     """Test that risk levels are reasonably distributed."""
     clause_texts = split_into_clauses(sample_contract_text, min_length=30)
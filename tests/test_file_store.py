@@ -0,0 +1,103 @@
+"""Test file-based contract storage."""
+
+from lexguard.config import settings
+from lexguard.models.clause import Clause, ClauseType
+from lexguard.models.contract import Contract
+from lexguard.storage.file_store import (
+    delete_contract,
+    list_contracts,
+    load_contract,
+    save_contract,
+)
+
+
+def _make_contract() -> Contract:
+    return Contract(
+        id="test-123",
+        title="Test Contract — Ünïcode",
+        original_filename="test.pdf",
+        text="This is a test contract.",
+        clauses=[
+            Clause(
+                id="c1",
+                contract_id="test-123",
+                index=0,
+                text="This agreement shall terminate upon notice.",
+                clause_type=ClauseType.TERMINATION,
+                risk_score=0.8,
+                risk_level="high",
+            )
+        ],
+    )
+
+
+def test_save_and_load_round_trip(tmp_path, monkeypatch):
+    """Test that a saved contract loads back unchanged."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    contract = _make_contract()
+
+    save_contract(contract)
+    loaded = load_contract(contract.id)
+
+    assert loaded == contract
+    assert load_contract("missing") is None
+
+
+def test_list_contracts_metadata(tmp_path, monkeypatch):
+    """Test that listings report clause and risk counts."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    save_contract(_make_contract())
+
+    [metadata] = list_contracts()
+
+    assert metadata.id == "test-123"
+    assert metadata.clause_count == 1
+    assert metadata.high_risk_count == 1
+
+
+def test_list_contracts_skips_unreadable_files(tmp_path, monkeypatch):
+    """Test that a corrupt contract file does not break the listing."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    save_contract(_make_contract())
+    (tmp_path / "contracts" / "broken.json").write_text("{not json")
+
+    assert [m.id for m in list_contracts()] == ["test-123"]
+
+
+def test_list_contracts_without_sidecar(tmp_path, monkeypatch):
+    """Test that contracts saved without a metadata sidecar are still listed."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    save_contract(_make_contract())
+    sidecar = tmp_path / "contracts" / "test-123.meta.json"
+    assert sidecar.exists()
+    sidecar.unlink()
+
+    [metadata] = list_contracts()
+
+    assert metadata.id == "test-123"
+    assert metadata.high_risk_count == 1
+
+
+def test_delete_contract_removes_sidecar(tmp_path, monkeypatch):
+    """Test that deleting a contract also removes its metadata sidecar."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    save_contract(_make_contract())
+
+    assert delete_contract("test-123")
+    assert list(tmp_path.joinpath("contracts").iterdir()) == []
+    assert not delete_contract("test-123")
+
+
+def test_save_contract_replaces_existing_file(tmp_path, monkeypatch):
+    """Test that re-saving overwrites the contract without leaving temp files."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    contract = _make_contract()
+    save_contract(contract)
+
+    save_contract(contract.model_copy(update={"title": "Renamed"}))
+
+    assert load_contract("test-123").title == "Renamed"
+    assert sorted(p.name for p in (tmp_path / "contracts").iterdir()) == [
+        "test-123.json",
+        "test-123.meta.json",
+    ]
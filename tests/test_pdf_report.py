@@ -0,0 +1,81 @@
+"""Test PDF report generation."""
+
+from lexguard.models.clause import Clause, ClauseType
+from lexguard.models.contract import Contract
+from lexguard.models.risk import ClauseRisk
+from lexguard.reports import pdf_report
+from lexguard.reports.pdf_report import generate_pdf_report, generate_pdf_reports_bulk
+
+
+def _make_contract() -> Contract:
+    return Contract(
+        id="test-123",
+        title="Test Contract",
+        original_filename="test.pdf",
+        text="This is a test contract.",
+        clauses=[
+            Clause(
+                id="c1",
+                contract_id="test-123",
+                index=0,
+                text="This agreement shall terminate upon notice.",
+                clause_type=ClauseType.TERMINATION,
+                risk_score=0.8,
+                risk_level="high",
+            ),
+            Clause(
+                id="c2",
+                contract_id="test-123",
+                index=1,
+                text="Party A shall pay Party B $100.",
+                clause_type=ClauseType.PAYMENT,
+                risk_score=0.2,
+                risk_level="low",
+            ),
+        ],
+    )
+
+
+def test_generate_pdf_report(tmp_path):
+    """Test that a PDF file is written to the requested path."""
+    contract = _make_contract()
+    risks = [
+        ClauseRisk(
+            clause_id="c1",
+            score=0.8,
+            level="high",
+            reasons=["Termination without cause"],
+            recommendations=["Add a notice period"],
+        ),
+        ClauseRisk(clause_id="c2", score=0.2, level="low", reasons=[], recommendations=[]),
+    ]
+
+    output_path = tmp_path / "report.pdf"
+    result = generate_pdf_report(contract, risks, "Summary paragraph.", output_path)
+
+    assert result == output_path
+    assert output_path.read_bytes().startswith(b"%PDF")
+
+
+def test_generate_pdf_report_without_risks(tmp_path):
+    """Test that a report is still produced when there are no risks."""
+    output_path = tmp_path / "empty.pdf"
+    generate_pdf_report(_make_contract(), [], "Summary.", output_path)
+
+    assert output_path.read_bytes().startswith(b"%PDF")
+
+
+def test_generate_pdf_reports_bulk(tmp_path, monkeypatch):
+    """Test that bulk generation writes one report per contract, in order."""
+    monkeypatch.setattr(pdf_report.os, "cpu_count", lambda: 2)
+
+    first = _make_contract()
+    second = _make_contract().model_copy(update={"id": "test-456"})
+    risks = [ClauseRisk(clause_id="c1", score=0.8, level="high", reasons=[], recommendations=[])]
+
+    paths = generate_pdf_reports_bulk(
+        [(first, risks, "First."), (second, [], "Second.")], output_dir=tmp_path
+    )
+
+    assert paths == [tmp_path / "report_test-123.pdf", tmp_path / "report_test-456.pdf"]
+    assert all(path.read_bytes().startswith(b"%PDF") for path in paths)
@@ -79,6 +79,9 @@ def test_score_to_level():
     assert score_to_level(0.5) == "medium"
     assert score_to_level(0.7) == "high"
     assert score_to_level(0.9) == "high"
+    # Thresholds belong to the higher level
+    assert score_to_level(0.33) == "medium"
+    assert score_to_level(0.66) == "high"
 
 
 def test_payment_clause_unpaid():
@@ -97,4 +100,190 @@ def test_payment_clause_unpaid():
     assert any("no pay" in r.lower() or "unpaid" in r.lower() for r in risk.reasons)
 
 
+def test_rescoring_after_text_update():
+    """Test that scoring uses the current text after a clause is edited."""
+    clause = Clause(
+        id="test_6",
+        contract_id="test_contract",
+        index=5,
+        text="This agreement may be terminated with 60 days notice.",
+        clause_type=ClauseType.TERMINATION,
+    )
+    calculate_clause_risk(clause, use_llm=False)
+
+    clause.text = "This agreement may be terminated IMMEDIATELY."
+    risk = calculate_clause_risk(clause, use_llm=False)
+
+    assert clause.text_lower == "this agreement may be terminated immediately."
+    assert any("immediate" in r.lower() for r in risk.reasons)
+
+
+def test_rescoring_after_model_copy():
+    """Test that a copy with edited text is scored on its own text."""
+    clause = Clause(
+        id="test_6b",
+        contract_id="test_contract",
+        index=5,
+        text="This agreement may be terminated with 60 days notice.",
+        clause_type=ClauseType.TERMINATION,
+    )
+    calculate_clause_risk(clause, use_llm=False)
+
+    edited = clause.model_copy(update={"text": "This agreement may be terminated IMMEDIATELY."})
+    risk = calculate_clause_risk(edited, use_llm=False)
+
+    assert edited.text_lower == "this agreement may be terminated immediately."
+    assert any("immediate" in r.lower() for r in risk.reasons)
+
+
+def test_repeated_clause_text_reuses_cached_score(monkeypatch):
+    """Test that identical clauses score alike without sharing mutable reasons."""
+    from lexguard.risk import scoring
+
+    def make_clause(clause_id: str) -> Clause:
+        return Clause(
+            id=clause_id,
+            contract_id="test_contract",
+            index=0,
+            text="Each party waives any claim for perpetual royalties.",
+            clause_type=ClauseType.MISC,
+        )
+
+    monkeypatch.setattr(scoring, "_risk_cache", scoring.OrderedDict())
+    first = calculate_clause_risk(make_clause("a"), use_llm=False)
+    first.reasons.append("edited by caller")
+    second = calculate_clause_risk(make_clause("b"), use_llm=False)
+
+    assert len(scoring._risk_cache) == 1
+    assert second.score == first.score
+    assert "edited by caller" not in second.reasons
+
+
+def test_contract_risks_match_per_clause_scoring(monkeypatch):
+    """Test that batch scoring matches scoring each clause on its own."""
+    from lexguard.risk import scoring
+    from lexguard.risk.scoring import calculate_contract_risks
+
+    texts = [
+        ("Supplier shall hold harmless the Client.", ClauseType.LIABILITY),
+        ("Either party may terminate without cause.", ClauseType.TERMINATION),
+        ("The Company may pay at will.", ClauseType.PAYMENT),
+        ("All work product belongs to the Company.", ClauseType.IP),
+        ("Hold", ClauseType.LIABILITY),
+        ("harmless", ClauseType.LIABILITY),
+    ]
+    clauses = [
+        Clause(id=f"c{i}", contract_id="test_contract", index=i, text=text, clause_type=clause_type)
+        for i, (text, clause_type) in enumerate(texts)
+    ]
+
+    monkeypatch.setattr(scoring, "_risk_cache", scoring.OrderedDict())
+    batch = calculate_contract_risks(clauses)
+    monkeypatch.setattr(scoring, "_risk_cache", scoring.OrderedDict())
+    single = [calculate_clause_risk(clause) for clause in clauses]
+
+    assert [(r.score, r.reasons) for r in batch] == [(r.score, r.reasons) for r in single]
+    assert "Contains hold harmless clause" not in batch[4].reasons
+
+    # Repeated boilerplate within one batch is scored once
+    applied = []
+    apply_rules = scoring._apply_rules
+    monkeypatch.setattr(
+        scoring, "_apply_rules", lambda *args: applied.append(args) or apply_rules(*args)
+    )
+    monkeypatch.setattr(scoring, "_risk_cache", scoring.OrderedDict())
+    repeated = calculate_contract_risks(clauses + clauses)
+    assert len(applied) == len(clauses)
+    assert [r.score for r in repeated] == [r.score for r in batch] * 2
+
+
+def test_numeric_rules_use_matched_unit():
+    """Test that notice and duration thresholds use the unit of the matched number."""
+    notice = Clause(
+        id="test_7",
+        contract_id="test_contract",
+        index=6,
+        text="Either party may terminate on 48 hours notice.",
+        clause_type=ClauseType.TERMINATION,
+    )
+    duration = Clause(
+        id="test_8",
+        contract_id="test_contract",
+        index=7,
+        text="Employee shall not compete for 18 months after the first year of service.",
+        clause_type=ClauseType.NON_COMPETE,
+    )
+
+    notice_risk = calculate_clause_risk(notice, use_llm=False)
+    duration_risk = calculate_clause_risk(duration, use_llm=False)
+
+    assert "Very short notice period (48 hours)" in notice_risk.reasons
+    assert "Long non-compete duration (18 months)" in duration_risk.reasons
+
+
+def test_contract_risks_async_blends_llm_scores(monkeypatch):
+    """Test that async contract scoring blends LLM verdicts and tolerates failures."""
+    import asyncio
+
+    from lexguard.risk import scoring
+    from lexguard.risk.scoring import calculate_contract_risks_async
+
+    def fake_llm_risk(clause):
+        if clause.id == "fails":
+            raise RuntimeError("LLM unavailable")
+        return 1.0, ["LLM flagged"]
+
+    monkeypatch.setattr(scoring, "_calculate_risk_with_llm", fake_llm_risk)
+
+    clauses = [
+        Clause(
+            id=clause_id,
+            contract_id="test_contract",
+            index=i,
+            text="The parties will cooperate in good faith.",
+            clause_type=ClauseType.MISC,
+        )
+        for i, clause_id in enumerate(["ok", "fails"])
+    ]
+
+    blended, rules_only = asyncio.run(calculate_contract_risks_async(clauses))
+
+    assert blended.score == pytest.approx(0.7 + 0.3 * rules_only.score)
+    assert blended.reasons[-1] == "LLM flagged"
+    assert rules_only.reasons == ["Standard misc clause"]
+    assert clauses[0].risk_level == blended.level
+
+
+def test_bulk_negotiation_suggestions(monkeypatch):
+    """Test that bulk suggestions call the LLM only for risky clauses."""
+    import asyncio
+
+    from lexguard.risk import negotiation
+
+    llm_calls = []
+
+    def fake_llm_suggestions(clause):
+        llm_calls.append(clause.id)
+        return [f"LLM advice for {clause.id}"]
+
+    monkeypatch.setattr(negotiation, "_get_llm_suggestions", fake_llm_suggestions)
+
+    clauses = [
+        Clause(
+            id=f"c{i}",
+            contract_id="test_contract",
+            index=i,
+            text="The parties will cooperate in good faith.",
+            clause_type=ClauseType.MISC,
+            risk_level=level,
+        )
+        for i, level in enumerate(["high", "low", "medium"])
+    ]
+
+    results = asyncio.run(negotiation.suggest_negotiation_points_bulk(clauses))
 
+    assert sorted(llm_calls) == ["c0", "c2"]
+    assert len(results) == 3
+    assert results[0][-1] == "LLM advice for c0"
+    assert results[1] == negotiation.suggest_negotiation_points(clauses[1])
+    assert results[2][-1] == "LLM advice for c2"
@@ -0,0 +1,123 @@
+"""Test contract summary generation."""
+
+from datetime import datetime
+
+from lexguard.config import settings
+from lexguard.models.clause import Clause, ClauseType
+from lexguard.models.contract import Contract
+from lexguard.reports import summary_builder
+from lexguard.reports.summary_builder import build_contract_summary, get_key_risks
+
+
+def _make_contract(text: str = "This is a test contract.") -> Contract:
+    return Contract(
+        id="test-123",
+        title="Test Contract",
+        original_filename="test.pdf",
+        text=text,
+        clauses=[
+            Clause(
+                id="c1",
+                contract_id="test-123",
+                index=0,
+                text="Party A shall pay Party B $100.",
+                clause_type=ClauseType.PAYMENT,
+                risk_level="low",
+            )
+        ],
+    )
+
+
+def test_rule_based_summary_without_clauses():
+    """Test the short summary for contracts with no extracted clauses."""
+    contract = _make_contract().model_copy(update={"clauses": []})
+
+    summary = build_contract_summary(contract)
+
+    assert "Test Contract" in summary
+    assert "No clauses were extracted" in summary
+
+
+def test_summary_reflects_updated_upload_time():
+    """Test that the summary shows the current upload time, including on copies."""
+    contract = _make_contract()
+    contract.uploaded_at = datetime(2024, 1, 2, 3, 4)
+    assert "Uploaded: 2024-01-02 03:04" in build_contract_summary(contract)
+
+    contract.uploaded_at = datetime(2025, 6, 7, 8, 9)
+    assert "Uploaded: 2025-06-07 08:09" in build_contract_summary(contract)
+
+    copied = contract.model_copy(update={"uploaded_at": datetime(2026, 1, 1, 0, 0)})
+    assert "Uploaded: 2026-01-01 00:00" in build_contract_summary(copied)
+
+
+def test_summary_uses_text_of_copied_clause():
+    """Test that excerpts come from the current text of a copied clause."""
+    contract = _make_contract()
+    build_contract_summary(contract)
+
+    edited = contract.clauses[0].model_copy(update={"text": "Party A shall pay $250 monthly."})
+    summary = build_contract_summary(contract.model_copy(update={"clauses": [edited]}))
+
+    assert "Party A shall pay $250 monthly." in summary
+    assert "Party B $100" not in summary
+
+
+def test_key_risks_format():
+    """Test that key risks show the clause type and a 100-character excerpt."""
+    contract = _make_contract()
+    long_clause = contract.clauses[0].model_copy(
+        update={"id": "c2", "index": 1, "text": "x" * 150, "clause_type": ClauseType.LIABILITY}
+    )
+    contract.clauses = [
+        contract.clauses[0].model_copy(update={"risk_level": "high"}),
+        long_clause.model_copy(update={"risk_level": "high"}),
+    ]
+
+    assert get_key_risks(contract) == [
+        "Payment: Party A shall pay Party B $100....",
+        f"Liability: {'x' * 100}...",
+    ]
+
+
+def test_llm_summary_is_cached(monkeypatch):
+    """Test that identical contract text reuses the cached LLM summary."""
+    calls = []
+
+    def fake_llm_summary(contract):
+        calls.append(contract.id)
+        return "LLM summary"
+
+    monkeypatch.setattr(summary_builder, "_build_llm_summary", fake_llm_summary)
+    monkeypatch.setattr(summary_builder, "_llm_summary_cache", summary_builder.OrderedDict())
+
+    text = "A unique contract body for the cache test."
+    first = build_contract_summary(_make_contract(text), use_llm=True)
+    second = build_contract_summary(_make_contract(text), use_llm=True)
+    build_contract_summary(_make_contract(text + " Amended."), use_llm=True)
+
+    assert first == second == "LLM summary"
+    assert len(calls) == 2
+
+
+def test_llm_summary_cache_is_per_model(monkeypatch):
+    """Test that switching the LLM model does not reuse another model's summary."""
+    calls = []
+
+    def fake_llm_summary(contract):
+        calls.append(settings.openai_model)
+        return f"Summary by {settings.openai_model}"
+
+    monkeypatch.setattr(summary_builder, "_build_llm_summary", fake_llm_summary)
+    monkeypatch.setattr(summary_builder, "_llm_summary_cache", summary_builder.OrderedDict())
+    monkeypatch.setattr(settings, "llm_provider", "openai")
+
+    contract = _make_contract("A contract body for the per-model cache test.")
+    monkeypatch.setattr(settings, "openai_model", "model-a")
+    first = build_contract_summary(contract, use_llm=True)
+    monkeypatch.setattr(settings, "openai_model", "model-b")
+    second = build_contract_summary(contract, use_llm=True)
+
+    assert first == "Summary by model-a"
+    assert second == "Summary by model-b"
+    assert calls == ["model-a", "model-b"]
@@ -0,0 +1,62 @@
+"""Test the clause vector store migration."""
+
+import pytest
+
+from lexguard.config import settings
+from lexguard.models.clause import Clause, ClauseType
+from lexguard.models.contract import Contract
+from lexguard.nlp import vector_store
+from lexguard.storage.chroma_store import get_chroma_client, reset_chroma_client
+from lexguard.storage.file_store import save_contract
+
+
+@pytest.fixture
+def chroma(tmp_path, monkeypatch):
+    """Point ChromaDB and contract storage at a fresh directory."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(settings, "chroma_db_path", tmp_path / "chroma")
+    monkeypatch.setattr(settings, "embedding_provider", "chromadb")
+    reset_chroma_client()
+    yield get_chroma_client()
+    reset_chroma_client()
+
+
+def _collection_names(client) -> set:
+    return {getattr(collection, "name", collection) for collection in client.list_collections()}
+
+
+def test_legacy_collection_is_migrated(chroma):
+    """Test that stored contracts move from the legacy collection to the cosine one."""
+    chroma.get_or_create_collection(vector_store.LEGACY_CLAUSE_COLLECTION)
+    save_contract(
+        Contract(
+            id="k1",
+            title="Test Contract",
+            original_filename="test.pdf",
+            text="Party A shall pay fees monthly.",
+            clauses=[
+                Clause(
+                    id="k1_0",
+                    contract_id="k1",
+                    index=0,
+                    text="Party A shall pay fees monthly.",
+                    clause_type=ClauseType.PAYMENT,
+                )
+            ],
+        )
+    )
+
+    assert vector_store.migrate_legacy_collection() == 1
+
+    assert _collection_names(chroma) == {vector_store.CLAUSE_COLLECTION}
+    results = vector_store.VectorStore().search_similar("k1", "monthly fees", k=1)
+    assert [result["id"] for result in results] == ["k1_0"]
+
+
+def test_migration_is_skipped_without_legacy_collection(chroma, monkeypatch):
+    """Test that startup does not reindex once the legacy collection is gone."""
+    monkeypatch.setattr(
+        vector_store, "reindex_contracts", lambda: pytest.fail("unexpected reindex")
+    )
+
+    assert vector_store.migrate_legacy_collection() == 0
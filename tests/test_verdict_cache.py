@@ -0,0 +1,83 @@
+"""Test the persistent LLM verdict cache."""
+
+import pytest
+
+from lexguard.config import settings
+from lexguard.llm import verdict_cache
+from lexguard.models import Clause, ClauseType
+from lexguard.risk import scoring
+
+
+@pytest.fixture
+def verdict_store(tmp_path, monkeypatch):
+    """Point the verdict cache at a fresh database."""
+    monkeypatch.setattr(settings, "data_dir", tmp_path)
+    monkeypatch.setattr(settings, "llm_verdict_cache", True)
+    verdict_cache._get_connection.cache_clear()
+    yield
+    verdict_cache._get_connection().close()
+    verdict_cache._get_connection.cache_clear()
+
+
+def test_keys_ignore_case_and_whitespace(verdict_store):
+    """Test that trivially different copies of a clause share one key."""
+    first = verdict_cache.verdict_key("risk", "1", "liability", "Party A  shall\nindemnify")
+    second = verdict_cache.verdict_key("risk", "1", "liability", "party a shall indemnify ")
+    other_version = verdict_cache.verdict_key("risk", "2", "liability", "party a shall indemnify")
+
+    assert first == second
+    assert first != other_version
+
+
+def test_llm_risk_verdict_is_reused(verdict_store, monkeypatch):
+    """Test that a repeated clause skips the LLM round-trip."""
+    calls = []
+
+    class FakeLLM:
+        def chat_structured(self, messages, schema):
+            calls.append(messages)
+            return {"score": 0.9, "reasons": ["One-sided indemnity"]}
+
+    monkeypatch.setattr("lexguard.llm.get_llm_client", lambda: FakeLLM())
+
+    def make_clause(text: str) -> Clause:
+        return Clause(
+            id="c1",
+            contract_id="test_contract",
+            index=0,
+            text=text,
+            clause_type=ClauseType.LIABILITY,
+        )
+
+    first = scoring._calculate_risk_with_llm(make_clause("Supplier shall indemnify Client."))
+    second = scoring._calculate_risk_with_llm(make_clause("Supplier shall  indemnify client."))
+
+    assert first == second == (0.9, ["One-sided indemnity"])
+    assert len(calls) == 1
+
+
+def test_unavailable_cache_falls_through(tmp_path, monkeypatch):
+    """Test that a broken cache database never fails the LLM call."""
+    calls = []
+
+    class FakeLLM:
+        def chat_structured(self, messages, schema):
+            calls.append(messages)
+            return {"score": 0.4, "reasons": ["Capped liability"]}
+
+    # The database path's parent directory does not exist, so opening fails
+    monkeypatch.setattr(settings, "data_dir", tmp_path / "missing")
+    monkeypatch.setattr(settings, "llm_verdict_cache", True)
+    monkeypatch.setattr("lexguard.llm.get_llm_client", lambda: FakeLLM())
+    verdict_cache._get_connection.cache_clear()
+
+    clause = Clause(
+        id="c1",
+        contract_id="test_contract",
+        index=0,
+        text="Liability is capped at fees paid.",
+        clause_type=ClauseType.LIABILITY,
+    )
+
+    assert scoring._calculate_risk_with_llm(clause) == (0.4, ["Capped liability"])
+    assert len(calls) == 1